@@ -0,0 +1,34 @@
+"""Joint optimization of production scheduling and preventive maintenance.
+
+Importing the package is cheap: the solver modules (and PuLP, NumPy, pandas)
+load only when one of the names below is first used.
+"""
+import importlib
+
+# Public name -> defining module
+_EXPORTS = {
+    "build_milp_model": "milp_solver",
+    "solve_lot_milp": "lot_milp",
+    "genetic_algorithm": "ga_solver",
+    "resume_genetic_algorithm": "ga_solver",
+    "island_genetic_algorithm": "island_ga",
+    "ParametricMakespanModel": "parametric_model",
+    "solve_makespan": "parametric_model",
+    "make_scenario": "scenario_sweep",
+    "run_sweep": "scenario_sweep",
+    "read_schedule": "schedule_export",
+    "evaluate_robustness": "robustness",
+    "load_data": "data",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,179 @@
+# Benchmarks for model build, CBC solve and GA throughput across instance sizes
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import queue
+import resource
+import subprocess
+import sys
+import time
+import numpy as np
+
+PANEL_COUNTS = [1000, 10000, 100000]
+POPULATION_SIZES = [50, 100, 200]
+GA_GENERATIONS = 20  # Generations timed per GA case
+SOLVE_MAX_PANELS = 10000  # Cold CBC solves grow quickly; larger instances only time the build
+POLL_SECONDS = 1.0  # How often run_case checks that the case process is still alive
+
+def peak_rss_mb(children=False):
+    """Peak resident set size of this process (or its waited-for children) in MiB."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    return usage.ru_maxrss * scale / 1024 ** 2
+
+def bench_milp_build(panels):
+    """Time milp_solver.build_milp_model (PuLP objects)."""
+    from .milp_solver import build_milp_model, pm_duration, processing_time
+    start = time.perf_counter()
+    model = build_milp_model(panels, processing_time, pm_duration)[0]
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "variables": model.numVariables(), "constraints": model.numConstraints()}
+
+def bench_cbc_solve(panels):
+    """Build, write and solve the per-panel model with CBC via matrix_milp; records each phase."""
+    from .matrix_milp import pm_duration, processing_time, solve_matrix_milp
+    result = solve_matrix_milp(panels, processing_time, pm_duration)
+    timings = result["timings"]
+    return {"status": result["status"], "seconds": sum(timings.values()), **timings,
+            "cbc_peak_rss_mb": peak_rss_mb(children=True)}
+
+def bench_ga(panels, population, generations):
+    """Time population setup and `generations` GA generations on a `panels`-panel chromosome.
+
+    Runs the same steps as ga_solver.genetic_algorithm, timed separately so that
+    generations/second reflects the evolution loop alone.
+    """
+    import random
+    from .ga_solver import breed, initialize_population, machines, population_evaluator, selection
+    random.seed(0)
+    milp_solution = [(i, m) for i in range(1, panels + 1) for m in machines]
+    start = time.perf_counter()
+    chromosomes = initialize_population(milp_solution, population)
+    setup = time.perf_counter() - start
+    with population_evaluator(1, population, len(chromosomes[0])) as evaluate:
+        start = time.perf_counter()
+        for _ in range(generations):
+            makespans, _ = evaluate(chromosomes)
+            parents = selection(chromosomes, makespans.tolist())
+            chromosomes = breed(parents, population)
+        seconds = time.perf_counter() - start
+    return {"seconds": seconds, "setup_seconds": setup, "generations": generations,
+            "generations_per_second": generations / seconds, "best_makespan": float(makespans.min())}
+
+BENCHMARKS = {"milp_build": bench_milp_build, "cbc_solve": bench_cbc_solve, "ga": bench_ga}
+
+def _run_case(name, args, results):
+    try:
+        record = BENCHMARKS[name](*args)
+    except Exception as exc:  # Report the failure instead of leaving the parent waiting
+        record = {"error": repr(exc), "seconds": None}
+    record["peak_rss_mb"] = peak_rss_mb()
+    results.put(record)
+
+def run_case(name, *args):
+    """Run one benchmark in a fresh interpreter so its peak RSS is not polluted by earlier cases.
+
+    A process that dies without reporting (e.g. killed by the OOM killer) is
+    recorded as a failed case instead of blocking the run.
+    """
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_run_case, args=(name, args, results))
+    process.start()
+    while True:
+        try:
+            record = results.get(timeout=POLL_SECONDS)
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                try:  # The record may have arrived just before the process exited
+                    record = results.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    record = {"error": f"process exited with code {process.exitcode} without a result",
+                              "seconds": None}
+                break
+    process.join()
+    return record
+
+def environment():
+    """Enough context to tell whether two result files are comparable."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def run_benchmarks(panel_counts=PANEL_COUNTS, population_sizes=POPULATION_SIZES, generations=GA_GENERATIONS,
+                   solve_max_panels=SOLVE_MAX_PANELS, benchmarks=tuple(BENCHMARKS)):
+    """Run every selected benchmark; returns {"environment": ..., "results": [records]}."""
+    results = []
+
+    def record(name, **params):
+        args = tuple(params.values())
+        outcome = run_case(name, *args)
+        results.append({"benchmark": name, **params, **outcome})
+        if "error" in outcome:
+            print(f"{name} {params}: failed with {outcome['error']}", file=sys.stderr)
+        else:
+            print(f"{name} {params}: {outcome['seconds']:.3f} s, peak RSS {outcome['peak_rss_mb']:.0f} MiB",
+                  file=sys.stderr)
+
+    for panels in panel_counts:
+        if "milp_build" in benchmarks:
+            record("milp_build", panels=panels)
+        if "cbc_solve" in benchmarks and panels <= solve_max_panels:
+            record("cbc_solve", panels=panels)
+        if "ga" in benchmarks:
+            for population in population_sizes:
+                record("ga", panels=panels, population=population, generations=generations)
+    return {"environment": environment(), "results": results}
+
+def case_key(result):
+    return (result["benchmark"], result["panels"], result.get("population"))
+
+def compare(baseline, current, metric="seconds"):
+    """Print `metric` of matching cases in two result files and the current/baseline ratio."""
+    previous = {case_key(result): result for result in baseline["results"]}
+    for result in current["results"]:
+        old = previous.get(case_key(result))
+        if old is None or result.get(metric) is None or old.get(metric) is None:
+            continue
+        ratio = result[metric] / old[metric] if old[metric] else float("nan")
+        name = " ".join(str(part) for part in case_key(result) if part is not None)
+        print(f"{name:<24} {old[metric]:>10.3f} -> {result[metric]:>10.3f}  x{ratio:.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark model build, CBC solve and GA throughput")
+    parser.add_argument("--panels", type=int, nargs="+", default=PANEL_COUNTS)
+    parser.add_argument("--population", type=int, nargs="+", default=POPULATION_SIZES)
+    parser.add_argument("--generations", type=int, default=GA_GENERATIONS)
+    parser.add_argument("--solve-max-panels", type=int, default=SOLVE_MAX_PANELS)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--output", help="Write the results as JSON to this file (default: stdout)")
+    parser.add_argument("--compare", help="Baseline JSON file to compare the new results against")
+    options = parser.parse_args(argv)
+
+    report = run_benchmarks(options.panels, options.population, options.generations,
+                            options.solve_max_panels, options.only)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if options.compare:
+        with open(options.compare) as f:
+            compare(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Single entry point for the solver scripts: pm-scheduling <command> [args...]
+import argparse
+import importlib
+import sys
+
+# Command name -> module whose main(argv) runs it; modules are imported only when chosen
+COMMANDS = {
+    "milp": "milp_solver",
+    "matrix": "matrix_milp",
+    "lots": "lot_milp",
+    "rolling": "rolling_horizon",
+    "ga": "ga_solver",
+    "islands": "island_ga",
+    "hybrid": "hybrid",
+    "serve": "job_service",
+    "robustness": "robustness",
+    "sensitivity-processing-time": "sensitivity_analysis_MILP_for_Processing_time",
+    "sensitivity-pm-duration": "sensitivity_analysis_MILP_for_PM_Duration",
+    "sensitivity-weekly-target": "sensitivity_analysis_MILP_for_Weekly_Production_Target",
+    "benchmark": "benchmark",
+}
+
+def show_data(argv):
+    """Print the parameters loaded from data.xlsx (via the cached snapshot) next to the solvers' constants."""
+    from .data import DATA_PATH, load_data
+    from .params import pm_duration, processing_time
+    parser = argparse.ArgumentParser(prog="pm-scheduling data", description="Show the parameters in data.xlsx")
+    parser.add_argument("path", nargs="?", default=DATA_PATH)
+    parser.add_argument("--refresh", action="store_true", help="Parse the workbook again and rewrite the snapshot")
+    options = parser.parse_args(argv)
+    data = load_data(options.path, refresh=options.refresh)
+    for m in data["machines"]:
+        print(f"{m}: processing time {data['processing_time'][m]:g} s, PM duration {data['pm_duration'][m] / 3600:g} hours, "
+              f"PM day {data['pm_day'][m]}, throughput {data['throughput'][m]['actual']:g}/{data['throughput'][m]['target']:g}")
+    # The solvers keep their hard-coded parameters; say whether the workbook still agrees with them
+    same = all(data["processing_time"].get(m) == processing_time[m] and data["pm_duration"].get(m) == pm_duration[m]
+               for m in processing_time)
+    print(f"The solvers use their built-in parameters, which {'match' if same else 'differ from'} this workbook.")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(prog="pm-scheduling", description="Joint production and PM scheduling")
+    parser.add_argument("command", choices=[*COMMANDS, "data"])
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments passed on to the command")
+    options = parser.parse_args(argv[:1])
+    if options.command == "data":
+        return show_data(argv[1:])
+    module = importlib.import_module(f".{COMMANDS[options.command]}", __package__)
+    return module.main(argv[1:])
+
+if __name__ == "__main__":
+    main()
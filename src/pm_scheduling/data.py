@@ -0,0 +1,75 @@
+# Project paths and the data.xlsx loader with a cached binary snapshot
+import os
+import pickle
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_PATH = os.path.join(PROJECT_ROOT, "data", "data.xlsx")
+RESULT_DIR = os.path.join(PROJECT_ROOT, "result")
+SNAPSHOT_VERSION = 1  # Bump when the parsed layout changes
+
+def snapshot_path(path):
+    """Hidden snapshot file next to the workbook."""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.snapshot")
+
+def _number(value):
+    """Parse workbook numbers, which are partly stored as comma-decimal strings ("22,5")."""
+    if isinstance(value, str):
+        return float(value.strip().replace(",", "."))
+    return float(value)
+
+def _rows(sheet):
+    """Data rows of a sheet keyed by the machine name in the first column."""
+    return {str(row[0]).strip(): row[1:] for row in sheet.itertuples(index=False)}
+
+def parse_workbook(path=DATA_PATH):
+    """Read the four sheets of data.xlsx into plain Python values (slow: uses pandas/openpyxl)."""
+    import pandas as pd
+    sheets = pd.read_excel(path, sheet_name=None, header=1)  # Row 0 is a title, row 1 the header
+    pm_schedule = sheets["PM schedule"]
+    days = list(pm_schedule.columns[1:])
+    pm_schedule = _rows(pm_schedule)
+    processing = _rows(sheets["Processing time"])
+    pm_duration = _rows(sheets["PM Duration"])
+    throughput = _rows(sheets["Throughput"])
+    machines = list(processing)
+    return {
+        "machines": machines,
+        "processing_time": {m: _number(processing[m][0]) for m in machines},  # Seconds
+        # The seconds column disagrees with the hours column for the Grinder (10700 vs 3 h),
+        # so durations come from the hours, as in the hard-coded parameters
+        "pm_duration": {m: _number(pm_duration[m][1]) * 3600 for m in machines},
+        "pm_day": {m: next(day for day, cell in zip(days, pm_schedule[m]) if isinstance(cell, str))
+                   for m in machines},
+        "throughput": {m: {"actual": _number(throughput[m][0]), "target": _number(throughput[m][1])}
+                       for m in machines},
+    }
+
+def load_data(path=DATA_PATH, refresh=False):
+    """Parameters from data.xlsx, served from a pickle snapshot while the workbook is unchanged.
+
+    The solvers do not read these values: they use the constants hard-coded in
+    params and ga_solver, and only ``pm-scheduling data`` calls this
+    loader. The snapshot records the workbook's size and modification time; any change,
+    or ``refresh=True``, parses the workbook again and rewrites the snapshot.
+    """
+    stat = os.stat(path)
+    stamp = (SNAPSHOT_VERSION, stat.st_size, stat.st_mtime_ns)
+    cache = snapshot_path(path)
+    if not refresh:
+        try:
+            with open(cache, "rb") as f:
+                cached_stamp, data = pickle.load(f)
+            if cached_stamp == stamp:
+                return data
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+    data = parse_workbook(path)
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:  # Read-only data directory: still return the parsed values
+        pass
+    return data
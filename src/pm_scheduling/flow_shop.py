@@ -0,0 +1,37 @@
+# Closed-form flow-shop backend for a fixed panel sequence
+import numpy as np
+from .params import available_time, machines
+
+def completion_times(panels_per_week, processing_time, machines=machines):
+    """Earliest completion time of every panel on every machine, shape (panels, machines).
+
+    Solves C[i][m] = max(C[i-1][m], C[i][m-1]) + p[m] with C[i][Grinder] = (i-1) * p[Grinder],
+    the same lower bounds as the MILP. With constant processing times the recurrence
+    unrolls to C[i][m] = (i+1) p[m] + max_{j<=i}(C[j][m-1] - j p[m]), a running maximum.
+    """
+    index = np.arange(panels_per_week, dtype=float)
+    C = np.empty((panels_per_week, len(machines)))
+    C[:, 0] = index * processing_time[machines[0]]
+    for m_idx in range(1, len(machines)):
+        p = processing_time[machines[m_idx]]
+        C[:, m_idx] = (index + 1) * p + np.maximum.accumulate(C[:, m_idx - 1] - index * p)
+    return C
+
+def solve_fast(panels_per_week, processing_time, pm_duration, machines=machines,
+               available_time=available_time):
+    """Evaluate the fixed-sequence makespan model without a MILP solver.
+
+    Returns a dict with the makespan (seconds), the completion time matrix, the
+    earliest feasible PM start per machine and whether every PM fits in the
+    net available time; ``status`` mirrors the LpStatus string of the CBC path.
+    """
+    C = completion_times(panels_per_week, processing_time, machines)
+    net_available_time = available_time - sum(pm_duration.values())
+    pm_start = {m: float(C[-1, m_idx] + processing_time[m]) for m_idx, m in enumerate(machines)}
+    feasible = all(pm_start[m] + pm_duration[m] <= net_available_time for m in machines)
+    return {
+        "status": "Optimal" if feasible else "Infeasible",
+        "makespan": float(C[-1, -1]),
+        "completion_times": C,
+        "pm_start": pm_start,
+    }
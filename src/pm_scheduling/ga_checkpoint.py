@@ -0,0 +1,76 @@
+# Binary checkpoints of a running Genetic Algorithm
+import os
+import random
+import numpy as np
+
+FORMAT_VERSION = 3  # 2 adds the baseline PM and processing times, 3 the operators; older files still load
+
+def save_checkpoint(path, population, generation, best_solution, best_makespan, best_pm_times, machines, pm_times,
+                    processing_time, operators):
+    """Atomically write the GA state as an uncompressed .npz archive.
+
+    The population is stored as two stacked matrices (uint32 panels, uint8
+    machine codes) and the RNG as the Mersenne Twister words, so a write is a
+    few buffer copies. ``pm_times`` (hours) and ``processing_time`` (seconds)
+    are the parameters the run's fitness uses and ``operators`` its encoding,
+    so a resumed run scores and breeds chromosomes the same way. The file is written next to ``path`` and renamed over
+    it, so an interrupted write leaves the previous checkpoint intact.
+    """
+    version, words, gauss_next = random.getstate()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            format_version=np.array(FORMAT_VERSION),
+            generation=np.array(generation),
+            panels=np.stack([chromosome.panels for chromosome in population]),
+            machine_codes=np.stack([chromosome.machines for chromosome in population]),
+            random_version=np.array(version),
+            random_words=np.array(words, dtype=np.uint32),
+            random_gauss=np.array(np.nan if gauss_next is None else gauss_next),
+            best_panels=best_solution.panels,
+            best_machine_codes=best_solution.machines,
+            best_makespan=np.array(best_makespan),
+            best_pm_times=np.array([best_pm_times[m] for m in machines]),
+            pm_times=np.array([pm_times[m] for m in machines]),
+            processing_time=np.array([processing_time[m] for m in machines]),
+            operators=np.array(operators),
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def load_checkpoint(path, machines):
+    """Read a checkpoint written by save_checkpoint.
+
+    Returns a dict of raw arrays and scalars; the caller rebuilds chromosomes
+    and restores the RNG with ``random.setstate(state["random_state"])``.
+    ``pm_times`` and ``processing_time`` are None for version 1 files and
+    ``operators`` for versions 1 and 2, which did not record them.
+    """
+    with np.load(path) as data:
+        if int(data["format_version"]) not in (1, 2, FORMAT_VERSION):
+            raise ValueError(f"Unsupported GA checkpoint version {int(data['format_version'])} in {path}")
+        gauss = float(data["random_gauss"])
+        return {
+            "generation": int(data["generation"]),
+            "panels": data["panels"],
+            "machine_codes": data["machine_codes"],
+            "random_state": (int(data["random_version"]), tuple(data["random_words"].tolist()),
+                             None if np.isnan(gauss) else gauss),
+            "best_panels": data["best_panels"],
+            "best_machine_codes": data["best_machine_codes"],
+            "best_makespan": float(data["best_makespan"]),
+            "best_pm_times": dict(zip(machines, data["best_pm_times"].tolist())),
+            "pm_times": dict(zip(machines, data["pm_times"].tolist())) if "pm_times" in data else None,
+            "processing_time": (dict(zip(machines, data["processing_time"].tolist()))
+                                if "processing_time" in data else None),
+            "operators": checkpoint_operators(data),
+        }
+
+def checkpoint_operators(data):
+    """Operators a checkpoint (a path or an open archive) was written with, or None if it predates version 3."""
+    if isinstance(data, (str, os.PathLike)):
+        with np.load(data) as archive:
+            return checkpoint_operators(archive)
+    return str(data["operators"]) if "operators" in data else None
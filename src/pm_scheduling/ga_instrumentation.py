@@ -0,0 +1,80 @@
+# Per-generation instrumentation and profiling hooks for the Genetic Algorithm
+import cProfile
+import io
+import json
+import pstats
+import sys
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    import pyinstrument
+except ImportError:  # Optional: only needed for profile="sampling"
+    pyinstrument = None
+
+PROFILE_TOP = 25  # Functions listed when a cProfile report is printed
+
+class JsonlSink:
+    """Generation callback appending each record as one JSON line; flushed per line."""
+
+    def __init__(self, path):
+        self.file = open(path, "a")
+
+    def __call__(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+def population_diversity(population):
+    """Mean L1 distance of each chromosome's checkpoint profile from the population mean.
+
+    Checkpoints hold per-machine operation counts at fixed positions, so the value
+    is normalized by the number of counted operations: 0 when every chromosome
+    assigns machines identically up to every checkpoint, larger when they spread.
+    """
+    profiles = np.stack([chromosome.checkpoints for chromosome in population]).astype(float)
+    deviation = np.abs(profiles - profiles.mean(axis=0)).sum(axis=(1, 2))
+    return float(deviation.mean() / max(profiles[0].sum(), 1.0))
+
+@contextmanager
+def profiled(profile=None, output=None):
+    """Run the body under cProfile ("cprofile") or pyinstrument ("sampling").
+
+    With ``output`` the cProfile stats (pstats format) or the sampling report
+    (text) are written to that file; otherwise a summary is printed.
+    """
+    if profile is None:
+        yield
+        return
+    if profile == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            if output:
+                profiler.dump_stats(output)
+            else:
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_TOP)
+                print(stream.getvalue())
+    elif profile == "sampling":
+        if pyinstrument is None:
+            raise ImportError("profile='sampling' requires the pyinstrument package")
+        profiler = pyinstrument.Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            report = profiler.output_text()
+            if output:
+                with open(output, "w") as f:
+                    f.write(report)
+            else:
+                print(report, file=sys.stdout)
+    else:
+        raise ValueError(f"Unknown profiler: {profile!r}")
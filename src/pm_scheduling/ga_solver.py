@@ -0,0 +1,984 @@
+# Genetic Algorithm code
+import argparse
+import hashlib
+import os
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from multiprocessing import shared_memory
+from operator import itemgetter
+import numpy as np
+from .data import RESULT_DIR
+from .ga_checkpoint import checkpoint_operators, load_checkpoint, save_checkpoint
+from .ga_instrumentation import JsonlSink, population_diversity, profiled
+try:
+    import xxhash  # Optional: faster chromosome hashing for the fitness cache
+except ImportError:
+    xxhash = None
+# Parameters 
+POP_SIZE = 100 
+GEN_LIMIT = 1000 
+CROSSOVER_RATE = 0.8 
+MUTATION_RATE = 0.2 
+CHECKPOINT_INTERVAL = 1024  # Operations between delta-evaluation checkpoints
+FITNESS_CACHE_BYTES = 64 * 1024 ** 2  # Memory cap of the fitness cache
+SAVE_INTERVAL = 25  # Generations between run checkpoints when checkpoint_path is set
+OPERATORS = ("legacy", "jox")  # Variation operators, see genetic_algorithm
+SEED_SWAPS = 0.01  # Fraction of positions swapped in each chromosome of a seeded population
+ 
+# Problem-specific parameters 
+num_panels = 15294  # Total number of panels 
+machines = ["Grinder", "VTD", "CHT"]  # Machines in sequence 
+processing_time = {  # Processing times in seconds 
+    "Grinder": 18.00, 
+    "VTD": 18.79, 
+    "CHT": 34.95 
+} 
+ 
+# Baseline PM times from MILP (in hours) 
+milp_pm_times = { 
+    "Grinder": 158.50, 
+    "VTD": 159.50, 
+    "CHT": 160.00 
+} 
+ 
+# Convert PM times to seconds for calculation 
+milp_pm_times_sec = {m: t * 3600 for m, t in milp_pm_times.items()} 
+
+pm_duration_sec = 3600  # Assume PM takes 1 hour
+machine_index = {m: k for k, m in enumerate(machines)}  # Integer machine codes
+
+# Chromosome representation
+class Chromosome:
+    """Operation sequence stored as uint32 panel ids and uint8 machine codes.
+
+    Behaves like the original list of ``(panel, machine)`` tuples for indexing,
+    slicing and concatenation, so the GA operators work on it unchanged while
+    copies and crossover slices are plain buffer copies. ``checkpoints`` holds
+    the per-machine progress used for delta evaluation (see build_checkpoints)
+    and ``fingerprint`` the cached hash used by FitnessCache.
+    """
+    __slots__ = ("panels", "machines", "checkpoints", "fingerprint")
+
+    def __init__(self, panels, machines, checkpoints=None):
+        self.panels = panels
+        self.machines = machines
+        self.checkpoints = checkpoints
+        self.fingerprint = None
+
+    @classmethod
+    def from_operations(cls, operations):
+        """Build a chromosome from a list of (panel, machine) tuples."""
+        count = len(operations)
+        panels = np.fromiter(map(itemgetter(0), operations), dtype=np.uint32, count=count)
+        codes = map(machine_index.__getitem__, map(itemgetter(1), operations))
+        return cls(panels, np.fromiter(codes, dtype=np.uint8, count=count))
+
+    def to_operations(self):
+        """Return the chromosome as a list of (panel, machine) tuples."""
+        return [(i, machines[k]) for i, k in zip(self.panels.tolist(), self.machines.tolist())]
+
+    def copy(self):
+        checkpoints = None if self.checkpoints is None else self.checkpoints.copy()
+        return Chromosome(self.panels.copy(), self.machines.copy(), checkpoints)
+
+    def take(self, order):
+        """Return a new chromosome with operations rearranged by an index array."""
+        return Chromosome(self.panels[order], self.machines[order])
+
+    @property
+    def nbytes(self):
+        return self.panels.nbytes + self.machines.nbytes
+
+    def __len__(self):
+        return len(self.panels)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return Chromosome(self.panels[key], self.machines[key])
+        return int(self.panels[key]), machines[self.machines[key]]
+
+    def __setitem__(self, key, operation):
+        self.fingerprint = None
+        self.panels[key] = operation[0]
+        self.machines[key] = machine_index[operation[1]]
+
+    def __add__(self, other):
+        return Chromosome(np.concatenate((self.panels, other.panels)),
+                          np.concatenate((self.machines, other.machines)))
+
+def as_chromosome(chromosome):
+    """Convert a list of (panel, machine) tuples to a Chromosome if needed."""
+    if isinstance(chromosome, Chromosome):
+        return chromosome
+    return Chromosome.from_operations(chromosome)
+ 
+# Helper functions 
+def initialize_population(milp_solution, pop_size, operators="legacy", seeded=False): 
+    """Initialize population using MILP result.
+
+    With ``seeded`` the MILP order is kept: the first chromosome is the MILP
+    sequence itself and the others differ from it by a few random swaps
+    (SEED_SWAPS) instead of being shuffled completely.
+    """ 
+    base = as_chromosome(milp_solution)
+    swaps = max(1, int(len(base) * SEED_SWAPS))
+    population = [] 
+    for index in range(pop_size): 
+        order = list(range(len(base)))
+        if not seeded:
+            random.shuffle(order)  # Add diversity 
+        elif index:
+            positions = random.sample(order, 2 * swaps)
+            for i, j in zip(positions[:swaps], positions[swaps:]):
+                order[i], order[j] = order[j], order[i]
+        chromosome = base.take(np.array(order))
+        if operators == "jox":  # Any panel order is a valid operation sequence
+            chromosome.machines = operation_ranks(chromosome.panels[None])[0]
+        chromosome.checkpoints = build_checkpoints(chromosome)
+        population.append(chromosome) 
+    return population 
+ 
+def calculate_makespan_and_pm(chromosome): 
+    """Calculate makespan and PM times based on the chromosome.""" 
+    completion_time = {m: 0 for m in machines} 
+    pm_times = {m: 0 for m in machines} 
+    pm_done = {m: False for m in machines}  # Track if PM has been scheduled 
+ 
+    for operation in chromosome: 
+        machine = operation[1] 
+        processing = processing_time[machine] 
+ 
+        # Add PM if not done yet and time exceeds baseline 
+        if not pm_done[machine] and completion_time[machine] >= milp_pm_times_sec[machine]: 
+            completion_time[machine] += pm_duration_sec 
+            pm_done[machine] = True 
+            pm_times[machine] = completion_time[machine] / 3600  # Convert to hours 
+ 
+        # Update the machine's completion time 
+        completion_time[machine] += processing 
+ 
+    # If PM is not done by the end, schedule it at the last moment 
+    for machine in machines: 
+        if not pm_done[machine]: 
+            completion_time[machine] += pm_duration_sec 
+            pm_done[machine] = True 
+            pm_times[machine] = completion_time[machine] / 3600  # Convert to hours 
+ 
+    return max(completion_time.values()), pm_times 
+ 
+def makespan_lower_bound(panels=num_panels):
+    """Makespan (seconds) that no schedule processing ``panels`` panels on every machine can beat.
+
+    Each machine must run all panels plus its PM, after the first panel has passed
+    the machines before it and before the last panel has passed the machines after
+    it. The largest such sum is the bottleneck bound (CHT workload and PM, with the
+    Grinder and VTD as head). It holds for the "jox" operators only: the legacy
+    fitness counts operations per machine without head or tail, so even a
+    complete legacy chromosome scores below it, and gap-based stopping is
+    refused for those operators (see genetic_algorithm).
+    """
+    bound = 0.0
+    for k, m in enumerate(machines):
+        head = sum(processing_time[h] for h in machines[:k])
+        tail = sum(processing_time[t] for t in machines[k + 1:])
+        bound = max(bound, head + panels * processing_time[m] + pm_duration_sec + tail)
+    return bound
+
+def set_pm_times(pm_times):
+    """Replace the baseline PM times (hours) the fitness inserts PMs at; returns the previous ones."""
+    previous = dict(milp_pm_times)
+    milp_pm_times.update(pm_times)
+    milp_pm_times_sec.update({m: t * 3600 for m, t in pm_times.items()})
+    _fitness_tables.clear()
+    return previous
+
+def set_processing_time(times):
+    """Replace the processing times (seconds) used by every fitness function; returns the previous ones."""
+    previous = dict(processing_time)
+    processing_time.update(times)
+    _fitness_tables.clear()
+    return previous
+
+@contextmanager
+def fitness_parameters(pm_times=None, processing_time=None):
+    """Use other baseline PM times (hours) or processing times (seconds) inside a block.
+
+    The previous values are restored on exit, so a seeded run or a what-if
+    scenario does not leak into later runs in the same process.
+    """
+    saved_pm_times = None if pm_times is None else set_pm_times(pm_times)
+    saved_processing_time = None if processing_time is None else set_processing_time(processing_time)
+    try:
+        yield
+    finally:
+        if saved_processing_time is not None:
+            set_processing_time(saved_processing_time)
+        if saved_pm_times is not None:
+            set_pm_times(saved_pm_times)
+
+def seed_from_milp(completion_times, pm_start):
+    """GA inputs from a MILP schedule: its operations by completion time, and its PM starts in hours.
+
+    ``completion_times`` is the (panels, machines) matrix and ``pm_start`` the
+    PM start per machine in seconds, as returned by milp_solver.solve_milp or
+    flow_shop.solve_fast. Pass the results as ``milp_solution`` and ``pm_times``
+    to genetic_algorithm.
+    """
+    completion_times = np.asarray(completion_times)
+    panels, codes = np.indices(completion_times.shape)
+    order = np.lexsort((codes.ravel(), completion_times.ravel()))
+    milp_solution = Chromosome((panels.ravel()[order] + 1).astype(np.uint32), codes.ravel()[order].astype(np.uint8))
+    return milp_solution, {m: float(pm_start[m]) / 3600 for m in machines}
+
+def completion_matrix(chromosome, operators="legacy"):
+    """Completion times of a chromosome as a (panels, machines) matrix, the layout the MILP uses.
+
+    Only chromosomes that run every panel exactly once per machine fill the
+    matrix, which "jox" chromosomes always do; legacy ones that repeat or drop
+    operations raise ValueError.
+    """
+    chromosome = as_chromosome(chromosome)
+    panels = int(chromosome.panels.max())
+    cells = (chromosome.panels.astype(np.intp) - 1) * len(machines) + chromosome.machines
+    if chromosome.panels.min() < 1 or not (np.bincount(cells, minlength=panels * len(machines)) == 1).all():
+        raise ValueError("chromosome does not run every panel once per machine (use operators='jox')")
+    times = operation_times(chromosome, operators)
+    matrix = np.empty((panels, len(machines)))
+    matrix[chromosome.panels.astype(np.intp) - 1, chromosome.machines] = times
+    return matrix
+
+# Vectorized fitness engine
+_fitness_tables = {}
+
+def fitness_tables(length):
+    """Completion and PM times (hours) per machine, indexed by how many operations it runs.
+
+    ``calculate_makespan_and_pm`` only depends on how many operations each machine
+    receives, so the sequential walk is done once per chromosome length and replayed
+    with the same float accumulation order, which keeps the results bit-identical.
+    """
+    if length not in _fitness_tables:
+        completion = np.empty((len(machines), length + 1))
+        pm = np.empty((len(machines), length + 1))
+        for k, m in enumerate(machines):
+            steps = np.full(length + 1, processing_time[m])
+            steps[0] = 0.0
+            before = np.add.accumulate(steps)  # Completion time before each operation
+            due = np.flatnonzero(before[:length] >= milp_pm_times_sec[m])
+            split = due[0] if len(due) else length  # Operation that triggers the PM
+
+            # PM not reached: it is scheduled after the last operation
+            completion[k, :split + 1] = before[:split + 1] + pm_duration_sec
+            pm[k, :split + 1] = completion[k, :split + 1] / 3600
+
+            # PM inserted before operation `split`, production resumes afterwards
+            steps = steps[split:].copy()
+            steps[0] = before[split] + pm_duration_sec
+            completion[k, split + 1:] = np.add.accumulate(steps)[1:]
+            pm[k, split + 1:] = steps[0] / 3600
+        _fitness_tables[length] = completion, pm
+    return _fitness_tables[length]
+
+def encode_population(population):
+    """Stack the machine codes of a population into one matrix."""
+    return np.stack([as_chromosome(chromosome).machines for chromosome in population])
+
+def evaluate_counts(counts, length):
+    """Calculate makespans and PM times (hours) from per-machine operation counts."""
+    completion, pm = fitness_tables(length)
+    machine_rows = np.arange(len(machines))
+    return completion[machine_rows, counts].max(axis=1), pm[machine_rows, counts]
+
+def evaluate_population(matrix):
+    """Calculate makespans and PM times (hours) for a whole machine-code matrix at once."""
+    pop_size, length = matrix.shape
+    num_machines = len(machines)
+    offsets = np.arange(pop_size)[:, None] * num_machines
+    counts = np.bincount((matrix + offsets).ravel(), minlength=pop_size * num_machines)
+    return evaluate_counts(counts.reshape(pop_size, num_machines), length)
+
+def operation_completion_times(chromosome):
+    """Completion time (seconds) of every operation, in chromosome order.
+
+    Follows calculate_makespan_and_pm: each machine runs its operations in the order
+    they appear and the PM is inserted before the first one starting at or after
+    the baseline PM time.
+    """
+    chromosome = as_chromosome(chromosome)
+    completion, _ = fitness_tables(len(chromosome))
+    times = np.empty(len(chromosome))
+    for k, m in enumerate(machines):
+        positions = np.flatnonzero(chromosome.machines == k)
+        steps = np.full(len(positions) + 1, processing_time[m])
+        steps[0] = 0.0
+        before = np.add.accumulate(steps)
+        due = np.flatnonzero(before[:-1] >= milp_pm_times_sec[m])
+        split = due[0] if len(due) else len(positions)
+        times[positions[:split]] = before[1:split + 1]
+        times[positions[split:]] = completion[k, split + 1:len(positions) + 1]  # Shifted by the PM
+    return times
+
+def schedule_population(panels, codes):
+    """Precedence-aware makespans, PM end times (hours) and operation completion times.
+
+    ``panels`` and ``codes`` are (rows, operations) matrices of valid schedules:
+    every panel once per machine. Each machine runs its operations in sequence
+    order, and an operation starts once the machine is free and the panel has
+    left the previous machine. With a constant processing time ``p`` the
+    recurrence ``C[t] = max(C[t-1], ready[t]) + p`` unrolls to
+    ``(t + 1) * p + max(ready[s] - s * p for s <= t)``, a running maximum over the
+    whole batch. The PM goes before the first operation the machine reaches at or
+    after the baseline PM time, as in calculate_makespan_and_pm.
+    """
+    rows, length = panels.shape
+    count = length // len(machines)
+    steps = np.arange(count)
+    row_index = np.arange(rows)
+    ready = np.zeros((rows, int(panels.max()) + 1))  # Panel completion on the previous machine
+    completion = np.empty((rows, length))
+    makespans = np.zeros(rows)
+    pm = np.empty((rows, len(machines)))
+    for k, m in enumerate(machines):
+        p = processing_time[m]
+        mask = codes == k
+        sequence = panels[mask].reshape(rows, count).astype(np.intp)
+        slack = np.take_along_axis(ready, sequence, axis=1) - steps * p
+        done = (steps + 1) * p + np.maximum.accumulate(slack, axis=1)
+        free = np.zeros((rows, count))  # Time the machine becomes free before each operation
+        free[:, 1:] = done[:, :-1]
+        due = free >= milp_pm_times_sec[m]
+        reached = due.any(axis=1)
+        split = due.argmax(axis=1)
+
+        # PM before operation `split`: raise its slack to the PM end and redo the running maximum
+        r, s = row_index[reached], split[reached]
+        pm_end = free[r, s] + pm_duration_sec
+        slack[r, s] = np.maximum(slack[r, s], pm_end - s * p)
+        done = (steps + 1) * p + np.maximum.accumulate(slack, axis=1)
+
+        end = done[:, -1] + np.where(reached, 0.0, pm_duration_sec)  # PM not reached: after the last operation
+        pm[:, k] = np.where(reached, 0.0, end) / 3600
+        pm[r, k] = pm_end / 3600
+        np.maximum(makespans, end, out=makespans)
+        completion[mask] = done.ravel()
+        ready = np.zeros_like(ready)
+        np.put_along_axis(ready, sequence, done, axis=1)
+    return makespans, pm, completion
+
+def operation_times(chromosome, operators="legacy"):
+    """Completion time (seconds) of every operation in chromosome order, under the operators' fitness."""
+    chromosome = as_chromosome(chromosome)
+    if operators == "jox":
+        return schedule_population(chromosome.panels[None], chromosome.machines[None])[2][0]
+    return operation_completion_times(chromosome)
+
+def production_makespan(chromosome, operators="legacy"):
+    """Completion (seconds) of the last operation: the makespan as the MILP counts it.
+
+    The GA fitness also counts a PM left for after the last operation; this
+    does not, so GA and MILP makespans can be compared. A PM inserted
+    mid-production still delays it. Call it under the run's fitness_parameters.
+    """
+    return float(operation_times(chromosome, operators).max())
+
+def evaluate_schedules(panels, codes):
+    """Calculate precedence-aware makespans and PM times (hours) for a batch of schedules."""
+    makespans, pm, _ = schedule_population(panels, codes)
+    return makespans, pm
+
+def export_best_solution(path, best_solution, best_makespan, best_pm_times, fmt="npy", operators="legacy"):
+    """Write the best chromosome as a columnar schedule (see schedule_export)."""
+    from .schedule_export import export_ga_schedule
+    chromosome = as_chromosome(best_solution)
+    # best_pm_times holds the hour each PM ends, as reported by calculate_makespan_and_pm
+    pm_start = {m: best_pm_times[m] * 3600 - pm_duration_sec for m in machines}
+    times = operation_times(chromosome, operators)
+    return export_ga_schedule(path, chromosome, times, pm_start, best_makespan, machines, fmt)
+
+# Delta evaluation
+def build_checkpoints(chromosome):
+    """Per-machine operation counts before every CHECKPOINT_INTERVAL-th position.
+
+    Row ``r`` covers positions ``[0, r * CHECKPOINT_INTERVAL)`` and the last row the
+    whole chromosome; each machine's completion time at a checkpoint is a lookup
+    of its count in fitness_tables, so the last row alone determines the fitness.
+    """
+    length = len(chromosome)
+    one_hot = chromosome.machines[:, None] == np.arange(len(machines), dtype=np.uint8)
+    checkpoints = np.zeros((-(-length // CHECKPOINT_INTERVAL) + 1, len(machines)), dtype=np.int64)
+    block_counts = np.add.reduceat(one_hot, np.arange(0, length, CHECKPOINT_INTERVAL), axis=0)
+    np.cumsum(block_counts, axis=0, out=checkpoints[1:])
+    return checkpoints
+
+def checkpoint_positions(length):
+    """Chromosome positions the checkpoint rows refer to."""
+    return np.minimum(np.arange(-(-length // CHECKPOINT_INTERVAL) + 1) * CHECKPOINT_INTERVAL, length)
+
+def prefix_counts(chromosome, point):
+    """Per-machine operation counts over positions ``[0, point)``."""
+    row = point // CHECKPOINT_INTERVAL
+    tail = chromosome.machines[row * CHECKPOINT_INTERVAL:point]
+    return chromosome.checkpoints[row] + np.bincount(tail, minlength=len(machines))
+
+def splice_checkpoints(head, tail, point):
+    """Checkpoints of ``head[:point] + tail[point:]`` without rescanning the chromosome."""
+    after = checkpoint_positions(len(head)) > point
+    checkpoints = head.checkpoints.copy()
+    checkpoints[after] = tail.checkpoints[after] + (prefix_counts(head, point) - prefix_counts(tail, point))
+    return checkpoints
+
+def swap_checkpoints(chromosome, i, j):
+    """Update checkpoints in place after swapping positions ``i`` and ``j``."""
+    i, j = min(i, j), max(i, j)
+    moved_in, moved_out = chromosome.machines[i], chromosome.machines[j]
+    if moved_in == moved_out:
+        return  # Same machine: no count changes anywhere
+    # Machine totals are unchanged, only checkpoints strictly between i and j shift
+    positions = checkpoint_positions(len(chromosome))
+    rows = (positions > i) & (positions <= j)
+    chromosome.checkpoints[rows, moved_out] -= 1
+    chromosome.checkpoints[rows, moved_in] += 1
+
+def population_counts(population):
+    """Per-machine operation totals for each chromosome, building checkpoints if missing."""
+    for chromosome in population:
+        if chromosome.checkpoints is None:
+            chromosome.checkpoints = build_checkpoints(chromosome)
+    return np.stack([chromosome.checkpoints[-1] for chromosome in population])
+
+def selection(population, fitness): 
+    """Select parents using highest throughput mechanism.""" 
+    order = np.argsort(fitness, kind="stable")  # Ties keep population order
+    return [population[i] for i in order[:2]]  # Return two best chromosomes 
+ 
+def crossover(parent1, parent2): 
+    """Perform multi-point crossover.""" 
+    point = random.randint(1, len(parent1) - 2) 
+    child1 = parent1[:point] + parent2[point:] 
+    child2 = parent2[:point] + parent1[point:] 
+    if getattr(parent1, "checkpoints", None) is not None and getattr(parent2, "checkpoints", None) is not None:
+        child1.checkpoints = splice_checkpoints(parent1, parent2, point)
+        child2.checkpoints = splice_checkpoints(parent2, parent1, point)
+    return child1, child2 
+ 
+def mutate(chromosome): 
+    """Perform mutation by swapping two random operations.""" 
+    if random.random() < MUTATION_RATE: 
+        i, j = random.sample(range(len(chromosome)), 2) 
+        chromosome[i], chromosome[j] = chromosome[j], chromosome[i] 
+        if getattr(chromosome, "checkpoints", None) is not None:
+            swap_checkpoints(chromosome, i, j)
+ 
+def breed(parents, pop_size):
+    """Build the next generation from the selected parents by crossover and mutation."""
+    new_population = [] 
+    while len(new_population) < pop_size: 
+        if random.random() < CROSSOVER_RATE: 
+            child1, child2 = crossover(parents[0], parents[1]) 
+            mutate(child1) 
+            mutate(child2) 
+            new_population.extend([child1, child2]) 
+        else: 
+            new_population.extend(parents) 
+    return new_population[:pop_size]
+
+# Operation-based encoding ("jox" operators)
+def operation_ranks(panels):
+    """Machine codes of operation sequences: the k-th occurrence of a panel runs on machine k.
+
+    With every panel appearing once per machine, any order of a row is a schedule
+    that respects the Grinder -> VTD -> CHT route.
+    """
+    if panels.max() < 2 ** 16:
+        panels = panels.astype(np.uint16)  # Stable sorts of 16-bit keys use radix sort
+    order = np.argsort(panels, axis=1, kind="stable")  # Occurrences of a panel stay in sequence order
+    ranks = np.tile(np.arange(len(machines), dtype=np.uint8), panels.shape[1] // len(machines))
+    codes = np.empty(panels.shape, dtype=np.uint8)
+    np.put_along_axis(codes, order, np.broadcast_to(ranks, panels.shape), axis=1)
+    return codes
+
+def jox_crossover(first, second, rng):
+    """Job-order crossover of ``first[r]`` with ``second[r]`` for every row at once.
+
+    Each child keeps the positions of a random half of the panels from the first
+    parent and fills the other positions with the remaining panels in the order
+    they appear in the second parent, so it still holds every operation once.
+    """
+    kept = rng.random((len(first), int(first.max()) + 1)) < 0.5
+    keep = np.take_along_axis(kept, first.astype(np.intp), axis=1)
+    fill = ~np.take_along_axis(kept, second.astype(np.intp), axis=1)
+    children = first.copy()
+    children[~keep] = second[fill]  # Row-major order: both sides hold the same count per row
+    return children
+
+def swap_mutation(children, rng):
+    """Swap two random operations in each row with probability MUTATION_RATE, in place."""
+    rows = np.flatnonzero(rng.random(len(children)) < MUTATION_RATE)
+    i = rng.integers(0, children.shape[1], len(rows))
+    j = rng.integers(0, children.shape[1], len(rows))
+    children[rows, i], children[rows, j] = children[rows, j], children[rows, i]
+
+def breed_operations(parents, pop_size):
+    """Batched counterpart of breed for operation sequences, using JOX and swap mutation.
+
+    The NumPy generator is seeded from ``random``, so seeded runs and resumed
+    checkpoints reproduce exactly.
+    """
+    rng = np.random.default_rng(random.getrandbits(64))
+    pairs = -(-pop_size // 2)
+    first = np.empty((2 * pairs, len(parents[0])), dtype=np.uint32)
+    first[0::2], first[1::2] = parents[0].panels, parents[1].panels
+    second = first.reshape(pairs, 2, -1)[:, ::-1].reshape(first.shape)
+    crossed = np.repeat(rng.random(pairs) < CROSSOVER_RATE, 2)  # Other pairs copy the parents
+    children = jox_crossover(first[crossed], second[crossed], rng)
+    swap_mutation(children, rng)
+    first[crossed] = children
+    panels = first[:pop_size]
+    codes = operation_ranks(panels)
+    new_population = []
+    for row in range(pop_size):
+        chromosome = Chromosome(panels[row].copy(), codes[row].copy())
+        chromosome.checkpoints = build_checkpoints(chromosome)
+        new_population.append(chromosome)
+    return new_population
+
+# Fitness cache
+class FitnessCache:
+    """LRU cache of (makespan, PM times) keyed by a hash of the chromosome buffers.
+
+    Entries are evicted least-recently-used first once the estimated size exceeds
+    ``max_bytes``; ``stats()`` reports hits, misses and the hit rate.
+    """
+    ENTRY_OVERHEAD = 200  # Approximate bytes of dict/array bookkeeping per entry
+
+    def __init__(self, max_bytes=FITNESS_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(chromosome):
+        """Hash a chromosome once; the digest is kept until the chromosome is modified."""
+        if chromosome.fingerprint is None:
+            digest = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+            digest.update(chromosome.panels)
+            digest.update(chromosome.machines)
+            chromosome.fingerprint = digest.digest()
+        return chromosome.fingerprint
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, makespan, pm_row):
+        if key in self.entries:
+            return
+        self.entries[key] = (makespan, pm_row)
+        self.nbytes += len(key) + pm_row.nbytes + self.ENTRY_OVERHEAD
+        while self.nbytes > self.max_bytes and self.entries:
+            old_key, (_, old_row) = self.entries.popitem(last=False)
+            self.nbytes -= len(old_key) + old_row.nbytes + self.ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+            "evictions": self.evictions,
+            "bytes": self.nbytes,
+        }
+
+def cached_evaluator(evaluate, cache):
+    """Wrap a population evaluator so only chromosomes missing from the cache are scored."""
+    def evaluate_cached(population):
+        makespans = np.empty(len(population))
+        pm_matrix = np.empty((len(population), len(machines)))
+        pending = {}  # Key -> rows sharing that chromosome
+        for row, chromosome in enumerate(population):
+            key = cache.key(chromosome)
+            if key in pending:  # Duplicate within this generation, scored once
+                cache.hits += 1
+                pending[key].append(row)
+                continue
+            value = cache.get(key)
+            if value is None:
+                pending[key] = [row]
+            else:
+                makespans[row], pm_matrix[row] = value
+        if pending:
+            rows = [group[0] for group in pending.values()]
+            new_makespans, new_pm = evaluate([population[row] for row in rows])
+            for (key, group), makespan, pm_row in zip(pending.items(), new_makespans, new_pm):
+                cache.put(key, float(makespan), pm_row.copy())
+                makespans[group] = makespan
+                pm_matrix[group] = pm_row
+        return makespans, pm_matrix
+    return evaluate_cached
+
+# Parallel evaluation
+_shared_population = None  # Worker-side view of the shared population matrix
+
+def _attach_population(name, shape, precedence=False, pm_times=None, processing_time=None):
+    """Process pool initializer: map the shared population matrices once per worker."""
+    global _shared_population
+    # Workers started by spawn do not see the parent's fitness_parameters
+    if pm_times is not None:
+        set_pm_times(pm_times)
+    if processing_time is not None:
+        set_processing_time(processing_time)
+    block = shared_memory.SharedMemory(name=name)
+    panels = np.ndarray(shape, dtype=np.uint32, buffer=block.buf) if precedence else None
+    offset = panels.nbytes if precedence else 0
+    _shared_population = (block, np.ndarray(shape, dtype=np.uint8, buffer=block.buf, offset=offset), panels)
+
+def _evaluate_rows(rows):
+    """Evaluate a contiguous row range of the shared population matrix."""
+    start, stop = rows
+    _, codes, panels = _shared_population
+    if panels is None:
+        return evaluate_population(codes[start:stop])
+    return evaluate_schedules(panels[start:stop], codes[start:stop])
+
+@contextmanager
+def population_evaluator(workers, pop_size, length, operators="legacy"):
+    """Yield a function scoring a population, serially or on a shared-memory process pool.
+
+    The "jox" operators are scored by the precedence-aware schedule_population,
+    which also needs the panel ids, so those are shared as well.
+    """
+    precedence = operators == "jox"
+    if workers <= 1:
+        if precedence:
+            yield lambda population: evaluate_schedules(np.stack([c.panels for c in population]),
+                                                        np.stack([c.machines for c in population]))
+        else:
+            yield lambda population: evaluate_counts(population_counts(population), length)
+        return
+
+    block = shared_memory.SharedMemory(create=True, size=pop_size * length * (5 if precedence else 1))
+    panels = np.ndarray((pop_size, length), dtype=np.uint32, buffer=block.buf) if precedence else None
+    matrix = np.ndarray((pop_size, length), dtype=np.uint8, buffer=block.buf,
+                        offset=panels.nbytes if precedence else 0)
+
+    def evaluate(population):
+        for row, chromosome in enumerate(population):
+            matrix[row] = chromosome.machines
+            if precedence:
+                panels[row] = chromosome.panels
+        bounds = np.linspace(0, len(population), workers + 1).astype(int)
+        chunks = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+        results = list(pool.map(_evaluate_rows, chunks))
+        return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+    try:
+        with ProcessPoolExecutor(workers, initializer=_attach_population,
+                                 initargs=(block.name, (pop_size, length), precedence, milp_pm_times,
+                                           processing_time)) as pool:
+            yield evaluate
+    finally:
+        del matrix, panels
+        block.close()
+        block.unlink()
+
+def genetic_algorithm(milp_solution, workers=1, seed=None, cache=None, pop_size=POP_SIZE, generations=GEN_LIMIT,
+                      callbacks=(), log_path=None, profile=None, profile_path=None,
+                      checkpoint_path=None, checkpoint_interval=SAVE_INTERVAL, resume_from=None,
+                      time_budget=None, stall_generations=None, gap_tolerance=None, lower_bound=None,
+                      operators=None, pm_times=None, seeded=False, robustness=None):
+    """Main Genetic Algorithm loop.
+
+    With ``workers > 1`` fitness is evaluated by a process pool reading the
+    population from shared memory. All random draws stay in this process, so a
+    fixed ``seed`` gives the same run for any number of workers. Passing a
+    FitnessCache (or ``cache=True`` for a default one) skips re-scoring
+    chromosomes seen before and prints its hit rate at the end.
+
+    Every callable in ``callbacks`` receives a dict per generation with the
+    seconds spent in evaluation, selection and variation, the number of
+    chromosomes actually scored, the population diversity and the best and
+    mean makespan; ``log_path`` appends the same records to a JSONL file.
+    ``profile`` ("cprofile" or "sampling") wraps the run in a profiler, see
+    ga_instrumentation.profiled.
+
+    With ``checkpoint_path`` the population, RNG state, best solution and
+    generation counter are saved every ``checkpoint_interval`` generations
+    (see ga_checkpoint). ``resume_from`` continues such a run up to
+    ``generations``; ``milp_solution``, ``seed``, ``pop_size`` and ``pm_times``
+    are then taken from the checkpoint, as are the processing times and the
+    operators, and the resumed run matches the uninterrupted one.
+
+    The run ends before ``generations`` when ``time_budget`` seconds have passed,
+    when the best makespan has not improved for ``stall_generations``
+    generations (counted from the start of this call), or when it is within
+    ``gap_tolerance`` (relative, e.g. 0.01) of ``lower_bound`` seconds, which
+    defaults to makespan_lower_bound for the chromosome length; the gap needs
+    the "jox" operators, whose fitness that bound holds for. All three are
+    off by default. A checkpoint is saved when the run stops early.
+
+    ``operators="jox"`` switches to an operation-based encoding: a chromosome is
+    an order of panel ids, each appearing once per machine, and the k-th
+    occurrence of a panel runs on the k-th machine (operation_ranks). Children
+    come from batched job-order crossover and swap mutation (breed_operations),
+    so every one is a valid schedule, and fitness is the precedence-aware
+    makespan from schedule_population. The default (None) is "legacy", the
+    original one-point crossover and count-based fitness, or on resume the
+    checkpoint's operators; other operators than the checkpoint's are refused
+    (see resolve_operators).
+
+    To start from a real MILP schedule, pass the output of seed_from_milp as
+    ``milp_solution`` and ``pm_times`` (hours; used instead of milp_pm_times
+    for this run only, see fitness_parameters) with ``seeded=True``, which
+    keeps the MILP order in the initial population (see initialize_population).
+
+    ``robustness`` is an evaluator returning scores and PM times (hours) for a
+    list of chromosomes, such as robustness.ga_fitness; it replaces the
+    nominal evaluation (and ``workers``), so its scores (e.g. the 95th
+    percentile makespan over sampled processing and PM times) drive selection
+    and the best solution, and go through the fitness cache and evaluation
+    counts. It needs the "jox" operators, whose chromosomes are complete
+    schedules.
+    """ 
+    state = load_checkpoint(resume_from, machines) if resume_from is not None else None
+    processing = None
+    operators = resolve_operators(operators, state["operators"] if state is not None else None)
+    if state is not None and state["pm_times"] is not None:
+        # A resumed run keeps the PM and processing times it started with
+        pm_times, processing = state["pm_times"], state["processing_time"]
+    with profiled(profile, profile_path), fitness_parameters(pm_times, processing):
+        return _genetic_algorithm(milp_solution, workers=workers, seed=seed, cache=cache, pop_size=pop_size,
+                                  generations=generations, callbacks=callbacks, log_path=log_path,
+                                  checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval,
+                                  state=state, time_budget=time_budget,
+                                  stall_generations=stall_generations, gap_tolerance=gap_tolerance,
+                                  lower_bound=lower_bound, operators=operators, seeded=seeded,
+                                  robustness=robustness)
+
+def resolve_operators(operators, checkpointed=None):
+    """Operators for a run: the requested ones, else the checkpoint's, else "legacy".
+
+    Raises ValueError when a resumed run asks for other operators than its
+    checkpoint was written with; checkpoints before format version 3 did not
+    record them (``checkpointed=None``) and take the requested ones.
+    """
+    if checkpointed is None:
+        return "legacy" if operators is None else operators
+    if operators is not None and operators != checkpointed:
+        raise ValueError(f"the checkpoint was written with operators={checkpointed!r}, got {operators!r}")
+    return checkpointed
+
+def resume_genetic_algorithm(path, generations=GEN_LIMIT, **options):
+    """Continue the run checkpointed at ``path``.
+
+    Further checkpoints go to the same file unless ``checkpoint_path`` is given.
+    """
+    options.setdefault("checkpoint_path", path)
+    return genetic_algorithm(None, generations=generations, resume_from=path, **options)
+
+def restore_population(state):
+    """Chromosomes of a loaded checkpoint, with their delta-evaluation checkpoints rebuilt."""
+    population = []
+    for panels, codes in zip(state["panels"], state["machine_codes"]):
+        chromosome = Chromosome(panels, codes)
+        chromosome.checkpoints = build_checkpoints(chromosome)
+        population.append(chromosome)
+    return population
+
+def _genetic_algorithm(milp_solution, workers, seed, cache, pop_size, generations, callbacks, log_path,
+                       checkpoint_path, checkpoint_interval, state, time_budget,
+                       stall_generations, gap_tolerance, lower_bound, operators, seeded, robustness):
+    if operators not in OPERATORS:
+        raise ValueError(f"Unknown operators {operators!r}, expected one of {OPERATORS}")
+    if gap_tolerance is not None and operators != "jox":
+        raise ValueError(f"gap_tolerance needs operators='jox': the lower bound does not hold for the "
+                         f"{operators!r} fitness")
+    if robustness is not None and operators != "jox":
+        raise ValueError(f"robustness needs operators='jox', whose chromosomes are complete schedules, "
+                         f"got {operators!r}")
+    if state is not None:
+        population = restore_population(state)
+        pop_size = len(population)
+        first_generation = state["generation"]
+        best_solution = Chromosome(state["best_panels"], state["best_machine_codes"])
+        best_makespan = state["best_makespan"]
+        best_pm_times = state["best_pm_times"]
+        random.setstate(state["random_state"])
+    else:
+        if seed is not None:
+            random.seed(seed)
+        population = initialize_population(milp_solution, pop_size, operators, seeded)
+        first_generation = 0
+        best_solution = None 
+        best_makespan = float('inf') 
+        best_pm_times = None 
+ 
+    if cache is True:
+        cache = FitnessCache()
+    callbacks = list(callbacks)
+    sink = JsonlSink(log_path) if log_path else None
+    if sink is not None:
+        callbacks.append(sink)
+    evaluations = 0
+    run_start = time.perf_counter()
+    if gap_tolerance is not None and lower_bound is None:
+        lower_bound = makespan_lower_bound(len(population[0]) // len(machines))
+    stall = 0
+    stop_reason = None
+
+    variation = breed_operations if operators == "jox" else breed
+
+    if robustness is None:
+        evaluator = population_evaluator(workers, pop_size, len(population[0]), operators)
+    else:
+        evaluator = nullcontext(robustness)
+    with evaluator as evaluate_all:
+        def evaluate(population):
+            nonlocal evaluations
+            evaluations += len(population)
+            return evaluate_all(population)
+
+        if cache is not None:
+            evaluate = cached_evaluator(evaluate, cache)
+        try:
+            for generation in range(first_generation, generations):
+                # Evaluate fitness 
+                start = time.perf_counter()
+                before = evaluations
+                makespans, pm_matrix = evaluate(population)
+                fitness = makespans.tolist()
+                evaluated = time.perf_counter()
+ 
+                # Update best solution 
+                i = int(np.argmin(makespans))
+                if fitness[i] < best_makespan: 
+                    best_makespan = fitness[i]
+                    best_solution = population[i] 
+                    best_pm_times = {m: float(pm_matrix[i, k]) for k, m in enumerate(machines)}
+                    stall = 0
+                else:
+                    stall += 1
+ 
+                # Selection 
+                parents = selection(population, fitness) 
+                selected = time.perf_counter()
+
+                if callbacks:
+                    diversity = population_diversity(population)
+
+                # Crossover and mutation, then replace old population 
+                population = variation(parents, pop_size)
+                bred = time.perf_counter()
+
+                if callbacks:
+                    record = {
+                        "generation": generation,
+                        "evaluate_seconds": evaluated - start,
+                        "selection_seconds": selected - evaluated,
+                        "variation_seconds": bred - selected,
+                        "evaluations": evaluations - before,
+                        "total_evaluations": evaluations,
+                        "diversity": diversity,
+                        "best_makespan": fitness[i],
+                        "mean_makespan": float(makespans.mean()),
+                        "best_so_far": best_makespan,
+                        "elapsed_seconds": bred - run_start,
+                    }
+                    for callback in callbacks:
+                        callback(record)
+ 
+                # Termination check 
+                if generation % 100 == 0: 
+                    print(f"Generation {generation}: Best Makespan = {best_makespan / 3600:.2f} hours") 
+
+                # Stopping criteria
+                if gap_tolerance is not None and best_makespan <= lower_bound * (1 + gap_tolerance):
+                    stop_reason = f"within {gap_tolerance:.2%} of the lower bound {lower_bound / 3600:.2f} hours"
+                elif stall_generations is not None and stall >= stall_generations:
+                    stop_reason = f"no improvement for {stall} generations"
+                elif time_budget is not None and time.perf_counter() - run_start >= time_budget:
+                    stop_reason = f"time budget of {time_budget:g} s used"
+
+                if checkpoint_path and ((generation + 1) % checkpoint_interval == 0 or stop_reason):
+                    save_checkpoint(checkpoint_path, population, generation + 1, best_solution, best_makespan,
+                                    best_pm_times, machines, milp_pm_times, processing_time, operators)
+                if stop_reason:
+                    print(f"Stopped after generation {generation}: {stop_reason}")
+                    break
+        finally:
+            if sink is not None:
+                sink.close()
+ 
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Fitness cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"hit rate = {stats['hit_rate']:.1%}, {stats['evictions']} evictions")
+ 
+    return best_solution, best_makespan, best_pm_times 
+ 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Genetic Algorithm and export the best schedule")
+    parser.add_argument("output", nargs="?", help="Schedule path (.parquet for Parquet, default result/schedule_ga)",
+                        default=os.path.join(RESULT_DIR, "schedule_ga"))
+    parser.add_argument("--checkpoint", help="Save the run state to this file every SAVE_INTERVAL generations")
+    parser.add_argument("--resume", help="Continue the run saved in this checkpoint file")
+    parser.add_argument("--time-budget", type=float, help="Stop after this many seconds")
+    parser.add_argument("--stall-generations", type=int, help="Stop after this many generations without improvement")
+    parser.add_argument("--gap", type=float, help="Stop once within this relative gap of the makespan lower bound")
+    parser.add_argument("--operators", choices=OPERATORS,
+                        help="Variation operators: legacy one-point crossover (default) or precedence-preserving "
+                             "JOX; a resumed run keeps its checkpoint's")
+    parser.add_argument("--workers", type=int, default=1, help="Processes evaluating fitness (same result for any count)")
+    parser.add_argument("--cache", action="store_true", help="Skip re-scoring chromosomes seen before (FitnessCache)")
+    parser.add_argument("--log-jsonl", help="Append one JSON record per generation to this file")
+    parser.add_argument("--profile", choices=("cprofile", "sampling"), help="Run under a profiler")
+    parser.add_argument("--profile-path", help="Write the profile to this file instead of printing a summary")
+    options = parser.parse_args(argv)
+    try:
+        operators = resolve_operators(options.operators,
+                                      checkpoint_operators(options.resume) if options.resume else None)
+    except ValueError as error:
+        parser.error(str(error))
+    if options.gap is not None and operators != "jox":
+        parser.error("--gap needs --operators jox: the lower bound does not hold for the legacy fitness")
+    run_options = {"time_budget": options.time_budget, "stall_generations": options.stall_generations,
+                "gap_tolerance": options.gap, "operators": operators, "workers": options.workers,
+                "cache": options.cache or None, "log_path": options.log_jsonl, "profile": options.profile,
+                "profile_path": options.profile_path}
+
+    if options.resume:
+        best_solution, best_makespan, best_pm_times = resume_genetic_algorithm(
+            options.resume, checkpoint_path=options.checkpoint or options.resume, **run_options)
+    else:
+        # Example MILP solution (to be replaced with actual MILP result) 
+        milp_solution = [(i, m) for i in range(1, num_panels + 1) for m in machines] 
+ 
+        # Run Genetic Algorithm 
+        best_solution, best_makespan, best_pm_times = genetic_algorithm(milp_solution, checkpoint_path=options.checkpoint,
+                                                                         **run_options)
+ 
+    # Output results 
+    print(f"Best Makespan: {best_makespan / 3600:.2f} hours") 
+    print("PM Times (hours):") 
+    for machine, pm_time in best_pm_times.items(): 
+        print(f"  {machine}: {pm_time:.2f} hours")
+
+    # Write the best schedule in columnar form
+    export_best_solution(options.output, best_solution, best_makespan, best_pm_times,
+                         "parquet" if options.output.endswith(".parquet") else "npy", operators)
+    print(f"Schedule written to {options.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Hybrid MILP -> GA -> MILP pipeline: each stage starts from the previous stage's schedule
+import sys
+import time
+from .flow_shop import solve_fast
+from .ga_solver import completion_matrix, fitness_parameters, genetic_algorithm, production_makespan, seed_from_milp
+from .milp_solver import available_time, machines, panels_per_week, pm_duration, processing_time, solve_milp
+
+GENERATIONS = 200
+
+def hybrid(panels_per_week=panels_per_week, processing_time=processing_time, pm_duration=pm_duration,
+           backend="fast", generations=GENERATIONS, operators="jox", msg=False, **ga_options):
+    """Solve the MILP, seed the GA with it, then re-solve the MILP from the best GA schedule.
+
+    ``backend`` picks the first stage: "fast" (flow_shop.solve_fast) or "cbc"
+    (a cold CBC solve). Its completion times order the GA's initial population
+    and its PM starts replace the GA's baseline PM times. The best GA
+    chromosome goes back to CBC as a MIP start. Returns one result per stage
+    under "milp", "ga" and "warm_milp", each with its wall time in "seconds".
+    Every ``makespan`` is the completion of the last operation; the GA's own
+    fitness, which also counts a PM after production, is in ga["fitness"].
+    The MIP start needs a complete schedule, so only the "jox" operators are
+    accepted.
+    """
+    if operators != "jox":
+        raise ValueError(f"hybrid needs operators='jox' for its MIP start, got {operators!r}")
+    started = time.perf_counter()
+    if backend == "fast":
+        milp = solve_fast(panels_per_week, processing_time, pm_duration, machines, available_time)
+    else:
+        milp = solve_milp(panels_per_week, processing_time, pm_duration, msg=msg)
+    milp["seconds"] = time.perf_counter() - started
+    if milp["status"] != "Optimal":
+        return {"milp": milp, "ga": None, "warm_milp": None}
+
+    started = time.perf_counter()
+    milp_solution, pm_times = seed_from_milp(milp["completion_times"], milp["pm_start"])
+    with fitness_parameters(pm_times, processing_time):
+        best_solution, best_fitness, best_pm_times = genetic_algorithm(
+            milp_solution, generations=generations, operators=operators, seeded=True, **ga_options)
+        makespan = production_makespan(best_solution, operators)
+    ga = {"best_solution": best_solution, "makespan": makespan, "fitness": best_fitness, "pm_times": best_pm_times,
+          "seconds": time.perf_counter() - started}
+
+    started = time.perf_counter()
+    with fitness_parameters(pm_times, processing_time):
+        initial_times = completion_matrix(best_solution, operators)
+    warm = solve_milp(panels_per_week, processing_time, pm_duration, initial_times=initial_times, msg=msg)
+    warm["seconds"] = time.perf_counter() - started
+    return {"milp": milp, "ga": ga, "warm_milp": warm}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    panels = int(argv[0]) if len(argv) > 0 else panels_per_week
+    backend = argv[1] if len(argv) > 1 else "fast"
+    result = hybrid(panels, backend=backend)
+    for stage in ("milp", "ga", "warm_milp"):
+        if result[stage] is None:
+            print(f"{stage}: skipped")
+        elif result[stage].get("status", "Optimal") != "Optimal":
+            print(f"{stage}: {result[stage]['status']} after {result[stage]['seconds']:.2f} s")
+        else:
+            print(f"{stage}: Makespan = {result[stage]['makespan'] / 3600:.2f} hours "
+                  f"in {result[stage]['seconds']:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Island-model Genetic Algorithm
+import multiprocessing as mp
+import queue
+import random
+import numpy as np
+from .ga_solver import (POP_SIZE, GEN_LIMIT, Chromosome, as_chromosome, breed, build_checkpoints,
+                       evaluate_counts, initialize_population, machines, num_panels,
+                       population_counts, selection)
+
+# Island parameters
+NUM_ISLANDS = 4
+MIGRATION_INTERVAL = 50  # Generations between migrations
+MIGRANTS = 2  # Elite chromosomes sent to each neighbouring island
+POLL_SECONDS = 1.0  # How often the parent checks that the islands are still alive
+
+def migration_targets(topology, num_islands):
+    """Return the list of destination islands for every island."""
+    if topology == "ring":
+        return [[(k + 1) % num_islands] for k in range(num_islands)]
+    if topology == "complete":
+        return [[j for j in range(num_islands) if j != k] for k in range(num_islands)]
+    if isinstance(topology, dict):
+        return [list(topology.get(k, [])) for k in range(num_islands)]
+    raise ValueError(f"Unknown migration topology: {topology!r}")
+
+def _run_island(index, seed, base, pop_size, generations, interval, migrants, targets, sources, inboxes, results):
+    """Evolve one island, exchanging elites with its neighbours every `interval` generations."""
+    random.seed(seed)
+    population = initialize_population(base, pop_size)
+    length = len(base)
+    best = (float('inf'), None, None)
+
+    for generation in range(generations):
+        makespans, pm_matrix = evaluate_counts(population_counts(population), length)
+        fitness = makespans.tolist()
+
+        i = int(np.argmin(makespans))
+        if fitness[i] < best[0]:
+            best = (fitness[i], population[i], {m: float(pm_matrix[i, k]) for k, m in enumerate(machines)})
+
+        if interval and generation > 0 and generation % interval == 0 and (targets or sources):
+            # Send elites, then replace the worst chromosomes with the immigrants
+            order = np.argsort(fitness, kind="stable")
+            elites = [(fitness[j], population[j].panels, population[j].machines) for j in order[:migrants]]
+            for target in targets:
+                inboxes[target].put((index, elites))
+            arrivals = sorted((inboxes[index].get() for _ in sources), key=lambda message: message[0])
+            immigrants = [elite for _, elites in arrivals for elite in elites]
+            for slot, (value, panels, codes) in zip(order[::-1], immigrants):
+                chromosome = Chromosome(panels, codes)
+                chromosome.checkpoints = build_checkpoints(chromosome)
+                population[slot] = chromosome
+                fitness[slot] = value
+
+        parents = selection(population, fitness)
+        population = breed(parents, pop_size)
+
+    makespan, solution, pm_times = best
+    results.put((index, makespan, solution.panels, solution.machines, pm_times))
+
+def _collect(processes, results):
+    """One result per island, in island order.
+
+    The queue is polled so that an island dying without a result (killed, out
+    of memory) is noticed: its neighbours would wait for its migrants forever,
+    so every island is terminated and RuntimeError is raised.
+    """
+    outcomes = {}
+    while len(outcomes) < len(processes):
+        try:
+            outcome = results.get(timeout=POLL_SECONDS)
+        except queue.Empty:
+            dead = [k for k, process in enumerate(processes) if k not in outcomes and not process.is_alive()]
+            if not dead:
+                continue
+            try:  # The result may have arrived just before the process exited
+                outcome = results.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                for process in processes:
+                    process.terminate()
+                for process in processes:
+                    process.join()
+                raise RuntimeError(f"island {dead[0]} exited with code {processes[dead[0]].exitcode} "
+                                   f"without a result") from None
+        outcomes[outcome[0]] = outcome
+    return [outcomes[k] for k in sorted(outcomes)]
+
+def island_genetic_algorithm(milp_solution, islands=NUM_ISLANDS, generations=GEN_LIMIT,
+                             migration_interval=MIGRATION_INTERVAL, migrants=MIGRANTS,
+                             topology="ring", seed=None, pop_size=POP_SIZE):
+    """Run independent GA populations in separate processes with periodic elite migration.
+
+    ``topology`` is "ring", "complete" or a dict mapping an island to its targets.
+    Island ``k`` is seeded with ``seed + k`` and immigrants are merged in source
+    order, so a fixed seed reproduces the run. Each island holds ``pop_size``
+    chromosomes. If an island exits without a result the others are stopped
+    and RuntimeError is raised.
+    """
+    base = as_chromosome(milp_solution)
+    targets = migration_targets(topology, islands)
+    sources = [[k for k in range(islands) if j in targets[k]] for j in range(islands)]
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    context = mp.get_context()
+    inboxes = [context.Queue() for _ in range(islands)]
+    results = context.Queue()
+    processes = [
+        context.Process(target=_run_island,
+                        args=(k, seed + k, base, pop_size, generations, migration_interval, migrants,
+                              targets[k], sources[k], inboxes, results))
+        for k in range(islands)
+    ]
+    for process in processes:
+        process.start()
+    # Drain results before joining so large chromosomes cannot block the pipes
+    outcomes = _collect(processes, results)
+    for process in processes:
+        process.join()
+
+    for index, makespan, _, _, _ in outcomes:
+        print(f"Island {index}: Best Makespan = {makespan / 3600:.2f} hours")
+    index, makespan, panels, codes, pm_times = min(outcomes, key=lambda outcome: (outcome[1], outcome[0]))
+    return Chromosome(panels, codes), makespan, pm_times
+
+def main(argv=None):
+    milp_solution = [(i, m) for i in range(1, num_panels + 1) for m in machines]
+    best_solution, best_makespan, best_pm_times = island_genetic_algorithm(milp_solution, seed=0)
+    print(f"Best Makespan: {best_makespan / 3600:.2f} hours")
+    print("PM Times (hours):")
+    for machine, pm_time in best_pm_times.items():
+        print(f"  {machine}: {pm_time:.2f} hours")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# Local what-if job service: HTTP over TCP or a Unix socket, backed by a bounded solver pool
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .scenario_sweep import ResultCache, make_scenario, scenario_key, solve_scenario
+from .milp_solver import machines, panels_per_week, pm_duration, processing_time
+
+HOST = "127.0.0.1"
+PORT = 8765
+SOLVERS = ("milp", "ga")
+MAX_PENDING = 64  # Distinct jobs queued or running before new ones are refused with 503
+MAX_BODY = 64 * 1024  # Bytes accepted in a request body
+GA_GENERATIONS = 200
+GA_TIME_BUDGET = 60.0  # Seconds per GA job, see ga_solver.genetic_algorithm
+MAX_PANELS = 10 * panels_per_week  # Largest panels_per_week a request may ask for
+MAX_GA_GENERATIONS = 5000
+MAX_GA_TIME_BUDGET = 600.0  # Upper bound on the seconds one GA job may hold a worker
+GA_RESULT_VERSION = 2  # Part of a GA job's cache key; bump when solve_job reports GA results differently
+
+def number(request, name, default, low, high):
+    """Request parameter ``name`` as a finite number in [low, high]; NaN and infinity are refused."""
+    value = request.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) \
+            or not low <= value <= high:
+        raise ValueError(f"{name} must be a number between {low:g} and {high:g}")
+    return value
+
+def integer(request, name, default, low, high):
+    """Request parameter ``name`` as a whole number in [low, high]; 200.0 is accepted, 200.7 is not."""
+    value = number(request, name, default, low, high)
+    if value != int(value):
+        raise ValueError(f"{name} must be a whole number")
+    return int(value)
+
+def make_job(request):
+    """Validate a request and turn it into a job: a scenario plus the solver and its options.
+
+    Missing parameters fall back to the weekly base case. Every number must
+    be finite, panel and generation counts whole, and panel counts and GA effort are capped (MAX_PANELS,
+    MAX_GA_GENERATIONS, MAX_GA_TIME_BUDGET) so one request cannot hold a
+    worker indefinitely. The job is JSON-serializable and its scenario_key
+    identifies identical requests.
+    """
+    solver = request.get("solver", "milp")
+    if solver not in SOLVERS:
+        raise ValueError(f"solver must be one of {SOLVERS}")
+    times = {**processing_time, **request.get("processing_time", {})}
+    durations = {**pm_duration, **request.get("pm_duration", {})}
+    if set(times) != set(machines) or set(durations) != set(machines):
+        raise ValueError(f"processing_time and pm_duration take the machines {machines}")
+    job = make_scenario(integer(request, "panels_per_week", panels_per_week, 1, MAX_PANELS), times, durations)
+    values = [*job["processing_time"].values(), *job["pm_duration"].values()]
+    if not all(map(math.isfinite, values)) or min(job["processing_time"].values()) <= 0 \
+            or min(job["pm_duration"].values()) < 0:
+        raise ValueError("processing times must be positive and PM durations non-negative finite numbers")
+    job["solver"] = solver
+    if solver == "ga":
+        job["ga"] = {
+            "generations": integer(request, "generations", GA_GENERATIONS, 1, MAX_GA_GENERATIONS),
+            "time_budget": float(number(request, "time_budget", GA_TIME_BUDGET, 0, MAX_GA_TIME_BUDGET)),
+        }
+        job["result_version"] = GA_RESULT_VERSION
+    return job
+
+def solve_job(job):
+    """Pool entry point: CBC via scenario_sweep.solve_scenario, or a GA seeded from the fixed-order schedule.
+
+    GA jobs use the scenario's processing times but the GA's own PM model
+    (ga_solver.pm_duration_sec); their status is "Feasible" since the GA proves
+    nothing about optimality. Both solvers report as ``makespan`` the
+    completion of the last operation (see ga_solver.production_makespan).
+    """
+    if job["solver"] == "milp":
+        return solve_scenario(job)
+    from . import ga_solver
+    from .flow_shop import solve_fast
+    milp = solve_fast(job["panels_per_week"], job["processing_time"], job["pm_duration"], job["machines"],
+                      job["available_time"])
+    if milp["status"] != "Optimal":
+        return {"status": milp["status"], "makespan": None, "pm_start": None}
+    milp_solution, pm_times = ga_solver.seed_from_milp(milp["completion_times"], milp["pm_start"])
+    # Pool workers are long-lived: the scenario's times apply to this solve only (and reach GA workers explicitly)
+    with ga_solver.fitness_parameters(pm_times, job["processing_time"]), \
+            contextlib.redirect_stdout(io.StringIO()):  # Keep the per-generation progress out of the service log
+        best, _, pm_end = ga_solver.genetic_algorithm(milp_solution, seed=0, operators="jox", seeded=True,
+                                                      **job["ga"])
+        makespan = ga_solver.production_makespan(best, "jox")
+    return {
+        "status": "Feasible",
+        "makespan": makespan,
+        "pm_start": {m: pm_end[m] * 3600 - ga_solver.pm_duration_sec for m in job["machines"]},
+    }
+
+class JobService:
+    """Solve jobs on at most ``workers`` processes, sharing results between identical requests.
+
+    A request is answered from the ResultCache when possible; otherwise it
+    joins the in-flight job with the same key or starts a new one. Each worker
+    runs one solve (and so one CBC subprocess) at a time, and jobs beyond the
+    pool size wait in the executor's queue, up to ``max_pending``.
+    """
+
+    def __init__(self, workers=None, cache=None, max_pending=MAX_PENDING):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = ResultCache() if cache is None else cache
+        self.max_pending = max_pending
+        # Spawned, not forked: forking after asyncio.to_thread has started threads can deadlock the workers
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn"))
+        self.in_flight = {}  # Key -> future shared by every request for that job
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "solved": 0, "failed": 0}
+
+    async def submit(self, job):
+        """Result of one job (see make_job) as {"key", "source", "result"}; source is cache, coalesced or solved."""
+        key = scenario_key(job)
+        self.stats["requests"] += 1
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return {"key": key, "source": "cache", "result": cached}
+        if key in self.in_flight:
+            self.stats["coalesced"] += 1
+            return {"key": key, "source": "coalesced", "result": await asyncio.shield(self.in_flight[key])}
+        if len(self.in_flight) >= self.max_pending:
+            raise OverflowError(f"{len(self.in_flight)} jobs pending, try again later")
+        future = asyncio.ensure_future(self._solve(key, job))
+        self.in_flight[key] = future
+        return {"key": key, "source": "solved", "result": await asyncio.shield(future)}
+
+    async def _solve(self, key, job):
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.pool, solve_job, job)
+            if self.cache:  # Before leaving in_flight, so a new request finds either the job or the result
+                await asyncio.to_thread(self.cache.put, key, result)
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            del self.in_flight[key]
+        self.stats["solved"] += 1
+        return result
+
+    async def route(self, method, path, body):
+        """HTTP status and JSON payload for one request."""
+        if method == "GET" and path == "/stats":
+            return 200, {**self.stats, "in_flight": len(self.in_flight), "workers": self.workers}
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if path != "/solve":
+            return 404, {"error": f"no route {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST /solve"}
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("the body must be a JSON object")
+            job = make_job(request)
+        except (ValueError, TypeError) as error:
+            return 400, {"error": str(error)}
+        try:
+            return 200, await self.submit(job)
+        except OverflowError as error:
+            return 503, {"error": str(error)}
+        except Exception as error:  # Solver failure: reported to every coalesced request, never cached
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+    async def handle(self, reader, writer):
+        """Serve one HTTP/1.1 request (Connection: close) from a stream pair."""
+        try:
+            method, path, _ = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY:
+                status, payload = 413, {"error": f"body larger than {MAX_BODY} bytes"}
+            else:
+                status, payload = await self.route(method, path, await reader.readexactly(length))
+        except (ValueError, asyncio.IncompleteReadError):
+            status, payload = 400, {"error": "malformed HTTP request"}
+        body = json.dumps(payload).encode()
+        writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+async def serve(host=HOST, port=PORT, unix_socket=None, workers=None, cache=None):
+    """Run the service until cancelled, on a Unix socket if ``unix_socket`` is given, else on host:port."""
+    service = JobService(workers, cache)
+    if unix_socket:
+        server = await asyncio.start_unix_server(service.handle, path=unix_socket)
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+    where = unix_socket or f"http://{host}:{port}"
+    print(f"Serving on {where} with {service.workers} solver processes")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve what-if scenario solves over HTTP")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--unix", help="Listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, help="Solver processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the result cache")
+    options = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix, options.workers,
+                          False if options.no_cache else None))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Lot-based MILP formulation
+import sys
+from .params import available_time, machines, panels_per_week, pm_duration, processing_time
+
+LOT_SIZE = 500  # Panels per lot
+
+def make_lots(panels, lot_size=LOT_SIZE):
+    """Split the panel sequence into consecutive lots; returns the lot sizes."""
+    lots = [lot_size] * (panels // lot_size)
+    if panels % lot_size:
+        lots.append(panels % lot_size)
+    return lots
+
+def build_lot_model(panels_per_week, processing_time, pm_duration, lot_size=LOT_SIZE,
+                    pm_windows=None, max_lots_between_pm=None, available_time=available_time,
+                    lots=None, ready_time=None, pm_deadline=None, pm_earliest=None, lot_release=None):
+    """Build the makespan MILP over lots of identical panels.
+
+    A lot only needs the completion of its first panel (S) and last panel (E) on
+    each machine: with identical panels the completion times inside a lot are
+    convex in the panel index, so E[j][m] >= max(S[j][m] + (q-1) p[m], E[j][m-1] + p[m])
+    is exact. Only the last lot bounds the makespan and the PM starts, which drops
+    the per-panel constraints that the no-overlap chain already implies.
+
+    ``pm_windows`` gives the number of PMs per machine (default 1). A PM can be
+    placed at any lot boundary, including after the last lot, and
+    ``max_lots_between_pm`` optionally limits how many lots may run between PMs.
+    As in the per-panel model a PM starts one cycle after the preceding panel, so
+    its start time is an expression of E and only the availability limit needs
+    a big-M term. Returns the model and a dict of its variables and expressions.
+
+    For rolling-horizon windows (see rolling_horizon): ``lots`` gives explicit lot
+    sizes, ``ready_time`` the time each machine becomes free (its first panel
+    completes at least one cycle later and a PM before the first lot starts
+    then), ``pm_deadline`` the absolute time each PM must end by instead of the
+    net available time, ``pm_earliest`` the time it may start at the earliest,
+    and ``lot_release`` maps a lot to the earliest time its first panel may
+    start on the first machine.
+    """
+    import pulp
+    if pm_windows is None:
+        pm_windows = {m: 1 for m in machines}
+    if lots is None:
+        lots = make_lots(panels_per_week, lot_size)
+    J = len(lots)
+    boundaries = range(J + 1)  # Boundary b is right before lot b; J is after the last lot
+
+    total_pm_time = sum(pm_windows[m] * pm_duration[m] for m in machines)
+    net_available_time = available_time - total_pm_time
+    deadline = pm_deadline or {m: net_available_time for m in machines}
+    latest_start = max([available_time, *(ready_time or {}).values(), *(lot_release or {}).values()])
+    big_m = latest_start + sum(lots) * sum(processing_time.values()) + total_pm_time
+
+    model = pulp.LpProblem("Minimize_Makespan_Lots", pulp.LpMinimize)
+
+    # Decision variables
+    C_max = pulp.LpVariable("C_max", lowBound=0, cat="Continuous")  # Makespan
+    S = pulp.LpVariable.dicts("First_Completion", ((j, m) for j in range(J) for m in machines), lowBound=0)
+    E = pulp.LpVariable.dicts("Last_Completion", ((j, m) for j in range(J) for m in machines), lowBound=0)
+    X = pulp.LpVariable.dicts("PM_At_Boundary", ((b, m) for b in boundaries for m in machines), cat="Binary")
+
+    # Start of a PM placed at each boundary (the first one starts at time 0)
+    T_PM = {(b, m): (E[(b - 1, m)] + processing_time[m] if b > 0
+                     else pulp.LpAffineExpression(constant=ready_time[m] if ready_time else 0))
+            for b in boundaries for m in machines}
+
+    # Objective: Minimize makespan
+    model += C_max, "Minimize_Makespan"
+
+    for j, q in enumerate(lots):
+        for m_idx, m in enumerate(machines):
+            # Panels of a lot run back to back on every machine
+            model += E[(j, m)] >= S[(j, m)] + (q - 1) * processing_time[m], f"Lot_Span_{m}_{j}"
+
+            if m_idx > 0:  # Route precedence for the first and last panel of the lot
+                prev_machine = machines[m_idx - 1]
+                model += S[(j, m)] >= S[(j, prev_machine)] + processing_time[m], f"Sequence_First_{m}_{j}"
+                model += E[(j, m)] >= E[(j, prev_machine)] + processing_time[m], f"Sequence_Last_{m}_{j}"
+
+            # No overlap with the previous lot, or with a PM placed right before this lot
+            model += (S[(j, m)] >= T_PM[(j, m)] + (pm_duration[m] + processing_time[m]) * X[(j, m)]), \
+                f"No_Overlap_{m}_{j}"
+
+    if ready_time:  # Carried-over machine state
+        for m in machines:
+            model += S[(0, m)] >= ready_time[m] + processing_time[m], f"Ready_{m}"
+    for j, release in (lot_release or {}).items():
+        first = machines[0]
+        model += S[(j, first)] >= release + processing_time[first], f"Release_{j}"
+
+    # Makespan: only the last lot on the last machine matters
+    model += C_max >= E[(J - 1, machines[-1])], "Makespan"
+
+    for m in machines:
+        model += pulp.lpSum(X[(b, m)] for b in boundaries) == pm_windows[m], f"PM_Frequency_{m}"
+        for b in boundaries:
+            model += (T_PM[(b, m)] + pm_duration[m] <= deadline[m]
+                      + big_m * (1 - X[(b, m)])), f"PM_Availability_{m}_{b}"
+            if pm_earliest and b > 0:
+                model += T_PM[(b, m)] >= pm_earliest[m] * X[(b, m)], f"PM_Earliest_{m}_{b}"
+        if pm_earliest and T_PM[(0, m)].constant < pm_earliest[m]:
+            model += X[(0, m)] == 0, f"PM_Earliest_{m}_0"  # A PM before the first lot starts at a fixed time
+        if max_lots_between_pm:
+            for b in range(J + 1 - max_lots_between_pm):
+                window = range(b, b + max_lots_between_pm + 1)
+                model += pulp.lpSum(X[(k, m)] for k in window) >= 1, f"PM_Spacing_{m}_{b}"
+
+    return model, {"C_max": C_max, "S": S, "E": E, "X": X, "T_PM": T_PM, "lots": lots}
+
+def solve_lot_milp(panels_per_week, processing_time, pm_duration, lot_size=LOT_SIZE,
+                   pm_windows=None, max_lots_between_pm=None, available_time=available_time, msg=False):
+    """Build and solve the lot model; returns status, makespan (hours) and PM start times (hours)."""
+    import pulp
+    model, variables = build_lot_model(panels_per_week, processing_time, pm_duration, lot_size,
+                                       pm_windows, max_lots_between_pm, available_time)
+    model.solve(pulp.PULP_CBC_CMD(msg=msg))
+    status = pulp.LpStatus[model.status]
+    result = {
+        "status": status,
+        "makespan": None,
+        "pm_starts": {},
+        "num_variables": model.numVariables(),
+        "num_constraints": model.numConstraints(),
+    }
+    if status == "Optimal":
+        J = len(variables["lots"])
+        result["makespan"] = pulp.value(variables["C_max"]) / 3600
+        result["pm_starts"] = {
+            m: [pulp.value(variables["T_PM"][(b, m)]) / 3600 for b in range(J + 1)
+                if pulp.value(variables["X"][(b, m)]) > 0.5]
+            for m in machines
+        }
+    return result
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lot_size = int(argv[0]) if len(argv) > 0 else LOT_SIZE
+    result = solve_lot_milp(panels_per_week, processing_time, pm_duration, lot_size)
+    print(f"Model size: {result['num_variables']} variables, {result['num_constraints']} constraints")
+    if result["status"] == "Optimal":
+        print(f"Optimal Makespan: {result['makespan']:.2f} hours")
+        for m in machines:
+            starts = ", ".join(f"{t:.2f}" for t in result["pm_starts"][m])
+            print(f"Machine {m}: PM Start Times = {starts} hours")
+    else:
+        print("No optimal solution found.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# Vectorized MILP builder: constraint matrix as NumPy arrays, bulk MPS output, direct CBC call
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from .params import available_time, machines, panels_per_week, pm_duration, processing_time
+
+class MatrixModel:
+    """The per-panel makespan MILP in coordinate (row, col, value) form.
+
+    Columns are ordered C[(i, m)] (row-major over panels), C_max, T_PM[m], Y[m]; the
+    binary Y columns come last so a single integer marker block covers them.
+    Constraint senses are "G", "L" or "E" per row.
+    """
+
+    def __init__(self, panels_per_week, num_machines, rows, cols, vals, senses, rhs):
+        self.panels_per_week = panels_per_week
+        self.num_machines = num_machines
+        self.rows = rows
+        self.cols = cols
+        self.vals = vals
+        self.senses = senses
+        self.rhs = rhs
+
+    @property
+    def num_columns(self):
+        return self.panels_per_week * self.num_machines + 1 + 2 * self.num_machines
+
+    @property
+    def c_max_column(self):
+        return self.panels_per_week * self.num_machines
+
+    @property
+    def num_rows(self):
+        return len(self.rhs)
+
+def matrix_rhs(panels_per_week, processing_time, pm_duration, machines=machines,
+               available_time=available_time):
+    """Right-hand side of every row, in the row order of build_matrix_model.
+
+    All constraint coefficients are +-1, so processing times and PM durations only
+    enter through this vector; a parameter change never touches the matrix.
+    """
+    n, M = panels_per_week, len(machines)
+    p = np.array([processing_time[m] for m in machines], dtype=float)
+    d = np.array([pm_duration[m] for m in machines], dtype=float)
+    net_available_time = available_time - d.sum()
+    return np.concatenate([
+        np.arange(n) * p[0],                          # Start_Grinder_Panel_i
+        np.broadcast_to(p[1:], (n, M - 1)).ravel(),   # Sequence_m_Panel_i
+        np.broadcast_to(p, (n - 1, M)).ravel(),       # No_Overlap_m_Panel_i
+        np.zeros(n),                                  # Makespan_Panel_i
+        np.ones(M),                                   # PM_Frequency_m
+        net_available_time - d,                       # PM_Availability_m
+        np.broadcast_to(p, (n, M)).ravel(),           # PM_Start_After_Production_m_Panel_i
+    ])
+
+def build_matrix_model(panels_per_week, processing_time, pm_duration, machines=machines,
+                       available_time=available_time):
+    """Assemble the same constraints as milp_solver.build_milp_model with array operations."""
+    n, M = panels_per_week, len(machines)
+    C = np.arange(n)[:, None] * M + np.arange(M)  # Column index of C[(i, m)]
+    c_max = n * M
+    t_pm = c_max + 1 + np.arange(M)
+    y = c_max + 1 + M + np.arange(M)
+
+    blocks = []  # (sense, row count, (cols, coefficient) terms)
+
+    def add(sense, count, *terms):
+        blocks.append((sense, count, terms))
+
+    # Start_Grinder_Panel_i: C[i, Grinder] >= (i - 1) * p[Grinder]
+    add("G", n, (C[:, 0], 1.0))
+    # Sequence_m_Panel_i: C[i, m] - C[i, m - 1] >= p[m]
+    add("G", n * (M - 1), (C[:, 1:].ravel(), 1.0), (C[:, :-1].ravel(), -1.0))
+    # No_Overlap_m_Panel_i: C[i, m] - C[i - 1, m] >= p[m]
+    add("G", (n - 1) * M, (C[1:].ravel(), 1.0), (C[:-1].ravel(), -1.0))
+    # Makespan_Panel_i: C_max - C[i, CHT] >= 0
+    add("G", n, (np.full(n, c_max), 1.0), (C[:, -1], -1.0))
+    # PM_Frequency_m: Y[m] == 1
+    add("E", M, (y, 1.0))
+    # PM_Availability_m: T_PM[m] <= net available time - PM duration
+    add("L", M, (t_pm, 1.0))
+    # PM_Start_After_Production_m_Panel_i: T_PM[m] - C[i, m] >= p[m]
+    add("G", n * M, (np.broadcast_to(t_pm, (n, M)).ravel(), 1.0), (C.ravel(), -1.0))
+
+    rows, cols, vals, senses = [], [], [], []
+    offset = 0
+    for sense, count, terms in blocks:
+        local = np.arange(offset, offset + count)
+        for term_cols, coefficient in terms:
+            rows.append(local)
+            cols.append(np.asarray(term_cols))
+            vals.append(np.full(count, coefficient))
+        senses.append(np.full(count, sense))
+        offset += count
+
+    rhs = matrix_rhs(panels_per_week, processing_time, pm_duration, machines, available_time)
+    return MatrixModel(n, M, np.concatenate(rows), np.concatenate(cols), np.concatenate(vals),
+                       np.concatenate(senses), rhs)
+
+def _lines(fmt, *columns):
+    """Format equally long columns into newline-terminated MPS records in one pass."""
+    return "".join(map(fmt.__mod__, zip(*(column.tolist() for column in columns))))
+
+def format_mps_columns(model):
+    """NAME, ROWS and COLUMNS sections of the MPS file, which no parameter affects."""
+    objective = model.num_rows  # The objective is written as the last, free row
+    cols = np.append(model.cols, model.c_max_column)
+    rows = np.append(model.rows, objective)
+    vals = np.append(model.vals, 1.0)
+    order = np.lexsort((rows, cols))  # COLUMNS section must be grouped by column
+    cols, rows, vals = cols[order], rows[order], vals[order]
+    first_binary = model.num_columns - model.num_machines
+    binary = cols >= first_binary
+    return "".join([
+        f"NAME          Minimize_Makespan\nROWS\n N  R{objective}\n",
+        _lines(" %s  R%d\n", model.senses, np.arange(model.num_rows)),
+        "COLUMNS\n",
+        _lines("    X%-7d  R%-7d  %.12e\n", cols[~binary], rows[~binary], vals[~binary]),
+        "    MARK      'MARKER'                 'INTORG'\n",
+        _lines("    X%-7d  R%-7d  %.12e\n", cols[binary], rows[binary], vals[binary]),
+        "    MARK      'MARKER'                 'INTEND'\n",
+    ])
+
+def format_mps_rhs(model):
+    """RHS and BOUNDS sections of the MPS file."""
+    nonzero = np.flatnonzero(model.rhs)
+    first_binary = model.num_columns - model.num_machines
+    return "".join([
+        "RHS\n",
+        _lines("    RHS       R%-7d  %.12e\n", nonzero, model.rhs[nonzero]),
+        "BOUNDS\n",
+        _lines(" BV BND       X%d\n", np.arange(first_binary, model.num_columns)),
+        "ENDATA\n",
+    ])
+
+def write_mps(model, path, columns_section=None):
+    """Write the model as an MPS file (PuLP's column layout) in a handful of bulk writes.
+
+    ``columns_section`` lets callers that only change the RHS reuse the formatted matrix.
+    """
+    with open(path, "w") as f:
+        f.write(columns_section if columns_section is not None else format_mps_columns(model))
+        f.write(format_mps_rhs(model))
+
+def read_cbc_solution(path, num_columns):
+    """Read a CBC solution file into a status string and a dense value vector."""
+    values = np.zeros(num_columns)
+    with open(path) as f:
+        header = f.readline()
+        records = f.read().replace("**", "").split()
+    header = header.lower()
+    if header.startswith("optimal"):
+        status = "Optimal"
+    elif "infeasible" in header:
+        status = "Infeasible"
+    elif "unbounded" in header:
+        status = "Unbounded"
+    else:
+        status = "Not Solved"
+    # Records are: index, name, value, reduced cost
+    names = records[1::4]
+    columns = np.array([int(name[1:]) for name in names], dtype=np.int64)
+    values[columns] = np.array(records[2::4], dtype=float)
+    return status, values
+
+def solve_matrix_milp(panels_per_week, processing_time, pm_duration, machines=machines,
+                      available_time=available_time, cbc_path=None, msg=False, workdir=None):
+    """Build, write and solve the per-panel MILP without PuLP constraint objects.
+
+    Returns the status, makespan (seconds), completion time matrix, PM starts and
+    a ``timings`` dict with separate build, write, solve and read seconds.
+    """
+    timings = {}
+    start = time.perf_counter()
+    model = build_matrix_model(panels_per_week, processing_time, pm_duration, machines, available_time)
+    timings["build"] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        mps_path = os.path.join(tmp, "model.mps")
+        solution_path = os.path.join(tmp, "model.sol")
+
+        start = time.perf_counter()
+        write_mps(model, mps_path)
+        timings["write"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        run_cbc(cbc_path, [mps_path, "-solve", "-solution", solution_path], msg)
+        timings["solve"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        status, values = read_cbc_solution(solution_path, model.num_columns)
+        timings["read"] = time.perf_counter() - start
+
+    return solution_result(model, machines, status, values, timings)
+
+def run_cbc(cbc_path, args, msg=False):
+    """Run the CBC executable with command-line arguments, hiding its log unless `msg`."""
+    import pulp
+    output = None if msg else subprocess.DEVNULL
+    subprocess.run([cbc_path or pulp.PULP_CBC_CMD().path, *args], stdout=output, stderr=output, check=True)
+
+def solution_result(model, machines, status, values, timings):
+    """Unpack a CBC value vector into makespan, completion times and PM schedule."""
+    n, M = model.panels_per_week, len(machines)
+    return {
+        "status": status,
+        "makespan": float(values[model.c_max_column]),
+        "completion_times": values[:n * M].reshape(n, M),
+        "pm_start": {m: float(values[n * M + 1 + k]) for k, m in enumerate(machines)},
+        "pm_scheduled": {m: float(values[n * M + 1 + M + k]) for k, m in enumerate(machines)},
+        "timings": timings,
+    }
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    panels = int(argv[0]) if len(argv) > 0 else panels_per_week
+    result = solve_matrix_milp(panels, processing_time, pm_duration)
+    timings = result["timings"]
+    print(f"Build: {timings['build']:.2f} s, write: {timings['write']:.2f} s, "
+          f"solve: {timings['solve']:.2f} s, read: {timings['read']:.2f} s")
+    if result["status"] == "Optimal":
+        print(f"Optimal Makespan: {result['makespan'] / 3600:.2f} hours")
+        for m in machines:
+            print(f"Machine {m}: PM Scheduled = {result['pm_scheduled'][m]}, "
+                  f"PM Start Time = {result['pm_start'][m] / 3600:.2f} hours")
+    else:
+        print("No optimal solution found.")
+
+if __name__ == "__main__":
+    main()
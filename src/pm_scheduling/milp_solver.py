@@ -0,0 +1,185 @@
+# MILP code
+import os
+import sys
+import time
+import numpy as np
+from .data import RESULT_DIR
+from .flow_shop import solve_fast
+from .params import available_time, machines, panels_per_week, pm_duration, processing_time
+ 
+BACKEND = "cbc"  # "cbc" solves the MILP, "fast" evaluates the fixed sequence with NumPy
+SCHEDULE_PATH = os.path.join(RESULT_DIR, "schedule_milp")
+ 
+def build_milp_model(panels_per_week, processing_time, pm_duration):
+    """Build the makespan MILP for a fixed panel order.
+
+    Returns the model with its C_max, C, Y and T_PM variables.
+    """
+    import pulp
+    # Calculate net available time 
+    total_pm_time = sum(pm_duration.values()) 
+    net_available_time = available_time - total_pm_time 
+ 
+    # Initialize model 
+    model = pulp.LpProblem("Minimize_Makespan", pulp.LpMinimize) 
+ 
+    # Decision variables 
+    C_max = pulp.LpVariable("C_max", lowBound=0, cat="Continuous")  # Makespan 
+    C = pulp.LpVariable.dicts( 
+        "Completion_Time", 
+        ((i, m) for i in range(1, panels_per_week + 1) for m in machines), 
+        lowBound=0, 
+        cat="Continuous" 
+    )  # Completion times 
+    Y = pulp.LpVariable.dicts("PM_Schedule", machines, cat="Binary")  # Preventive maintenance scheduling 
+    T_PM = pulp.LpVariable.dicts("PM_Start_Time", machines, lowBound=0, 
+    cat="Continuous")  # Start time of PM 
+ 
+    # Objective: Minimize makespan 
+    model += C_max, "Minimize_Makespan" 
+ 
+    # Constraints 
+    for i in range(1, panels_per_week + 1): 
+        for m_idx, m in enumerate(machines): 
+            if m_idx == 0:  # First machine (Grinder) 
+                # Start time for the first machine 
+                model += C[(i, m)] >= (i - 1) * processing_time[m], f"Start_Grinder_Panel_{i}" 
+            else: 
+                # Sequence constraint: Operation must wait for the previous machine to complete 
+                prev_machine = machines[m_idx - 1] 
+                model += C[(i, m)] >= C[(i, prev_machine)] + processing_time[m], f"Sequence_{m}_Panel_{i}" 
+ 
+            # Ensure that the current panel finishes processing before the next one starts 
+            if i > 1: 
+                model += C[(i, m)] >= C[(i - 1, m)] + processing_time[m], f"No_Overlap_{m}_Panel_{i}" 
+ 
+    # Makespan constraint: C_max must be greater than or equal to the completion of the last panel on the last machine 
+    for i in range(1, panels_per_week + 1): 
+        model += C_max >= C[(i, "CHT")], f"Makespan_Panel_{i}" 
+ 
+    # PM constraints 
+    for m in machines: 
+        # Each machine undergoes 1 PM per week 
+        model += Y[m] == 1, f"PM_Frequency_{m}" 
+ 
+        # PM must occur during available time 
+        model += T_PM[m] + pm_duration[m] <= net_available_time, f"PM_Availability_{m}" 
+ 
+        # PM cannot overlap with production 
+        for i in range(1, panels_per_week + 1): 
+            model += T_PM[m] >= C[(i, m)] + processing_time[m], f"PM_Start_After_Production_{m}_Panel_{i}"
+ 
+    return model, C_max, C, Y, T_PM
+ 
+def cross_check(panels_per_week=50, processing_time=processing_time, pm_duration=pm_duration, tolerance=1e-6):
+    """Compare the fast backend with CBC on a small instance; returns both makespans in seconds."""
+    import pulp
+    model, C_max, C, Y, T_PM = build_milp_model(panels_per_week, processing_time, pm_duration)
+    model.solve(pulp.PULP_CBC_CMD(msg=False))
+    fast = solve_fast(panels_per_week, processing_time, pm_duration, machines, available_time)
+    if pulp.LpStatus[model.status] != fast["status"]:
+        raise AssertionError(f"CBC status {pulp.LpStatus[model.status]} != fast status {fast['status']}")
+    if fast["status"] != "Optimal":
+        return None, None
+    if abs(pulp.value(C_max) - fast["makespan"]) > tolerance * max(1.0, fast["makespan"]):
+        raise AssertionError(f"CBC makespan {pulp.value(C_max)} != fast makespan {fast['makespan']}")
+    return pulp.value(C_max), fast["makespan"]
+
+def solution_values(C, T_PM):
+    """Completion time matrix (panels x machines) and PM starts, read straight from the variables."""
+    completion_times = np.fromiter((variable.varValue for variable in C.values()), dtype=float, count=len(C))
+    return completion_times.reshape(-1, len(machines)), {m: T_PM[m].varValue for m in machines}
+
+def mip_start_times(completion_times, processing_time=processing_time):
+    """Completion time matrix the MILP accepts as a MIP start, built from any schedule.
+
+    Panels are identical, so the k-th completion on each machine is given to
+    panel k; times are then pushed forward wherever the fixed-order constraints
+    require it, which makes the start feasible even for a schedule that ignores
+    route precedence (the legacy GA evaluator).
+    """
+    times = np.sort(np.asarray(completion_times, dtype=float), axis=0)
+    index = np.arange(len(times), dtype=float)
+    start = np.empty_like(times)
+    previous = index * processing_time[machines[0]]  # Start_Grinder lower bound
+    for m_idx, m in enumerate(machines):
+        p = processing_time[m]
+        if m_idx > 0:
+            previous = start[:, m_idx - 1] + p  # Sequence constraint
+        # No_Overlap as a running maximum: C[k] = max(b[k], C[k-1] + p)
+        start[:, m_idx] = index * p + np.maximum.accumulate(np.maximum(times[:, m_idx], previous) - index * p)
+    return start
+
+def set_mip_start(C, T_PM, Y, C_max, start):
+    """Give every variable the initial value of the ``start`` matrix (see mip_start_times)."""
+    for (i, m), variable in C.items():
+        variable.setInitialValue(start[i - 1, machines.index(m)])
+    for m_idx, m in enumerate(machines):
+        Y[m].setInitialValue(1)
+        T_PM[m].setInitialValue(start[-1, m_idx] + processing_time[m])
+    C_max.setInitialValue(start[:, -1].max())
+
+def solve_milp(panels_per_week, processing_time, pm_duration, initial_times=None, msg=False):
+    """Build and solve the MILP with CBC, optionally from a MIP start.
+
+    ``initial_times`` is a (panels, machines) completion time matrix of any
+    schedule, e.g. the best GA chromosome; it is made feasible with
+    mip_start_times and passed to CBC with ``warmStart=True``. Returns the same
+    keys as flow_shop.solve_fast plus ``solve_seconds``.
+    """
+    import pulp
+    model, C_max, C, Y, T_PM = build_milp_model(panels_per_week, processing_time, pm_duration)
+    if initial_times is not None:
+        set_mip_start(C, T_PM, Y, C_max, mip_start_times(initial_times, processing_time))
+    started = time.perf_counter()
+    model.solve(pulp.PULP_CBC_CMD(msg=msg, warmStart=initial_times is not None))
+    result = {"status": pulp.LpStatus[model.status], "solve_seconds": time.perf_counter() - started,
+              "makespan": None, "completion_times": None, "pm_start": None}
+    if result["status"] == "Optimal":
+        result["makespan"] = pulp.value(C_max)
+        result["completion_times"], result["pm_start"] = solution_values(C, T_PM)
+    return result
+
+def schedule_format(path):
+    return "parquet" if path.endswith(".parquet") else "npy"
+ 
+def main(argv=None):
+    from .schedule_export import export_milp_schedule  # Imported here: it pulls in pyarrow
+    argv = sys.argv[1:] if argv is None else argv
+    backend = argv[0] if len(argv) > 0 else BACKEND
+    output = argv[1] if len(argv) > 1 else SCHEDULE_PATH
+ 
+    if backend == "fast":
+        result = solve_fast(panels_per_week, processing_time, pm_duration, machines, available_time)
+        if result["status"] == "Optimal":
+            print(f"Optimal Makespan: {result['makespan'] / 3600:.2f} hours")
+            for m in machines:
+                print(f"Machine {m}: PM Scheduled = 1, PM Start Time = {result['pm_start'][m] / 3600:.2f} hours")
+            export_milp_schedule(output, result["completion_times"], result["pm_start"], result["makespan"],
+                                 machines, schedule_format(output), source="fast")
+            print(f"Schedule written to {output}")
+        else:
+            print("No optimal solution found.")
+        return
+
+    import pulp
+    model, C_max, C, Y, T_PM = build_milp_model(panels_per_week, processing_time, pm_duration)
+ 
+    # Solve the model 
+    solver = pulp.PULP_CBC_CMD() 
+    model.solve(solver) 
+ 
+    # Output results 
+    if pulp.LpStatus[model.status] == "Optimal": 
+        print(f"Optimal Makespan: {pulp.value(C_max) / 3600:.2f} hours") 
+        for m in machines: 
+            print(f"Machine {m}: PM Scheduled = {pulp.value(Y[m])}, PM Start Time = {pulp.value(T_PM[m]) / 3600:.2f} hours") 
+        completion_times, pm_start = solution_values(C, T_PM)
+        export_milp_schedule(output, completion_times, pm_start, pulp.value(C_max), machines,
+                             schedule_format(output))
+        print(f"Schedule written to {output}")
+    else: 
+        print("No optimal solution found.")
+
+if __name__ == "__main__":
+    main()
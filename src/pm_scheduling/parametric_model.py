@@ -0,0 +1,115 @@
+# Parametric makespan model: build once, update parameters in place, warm-started re-solves
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from collections import OrderedDict
+from .matrix_milp import (available_time, build_matrix_model, format_mps_columns, machines, matrix_rhs,
+                         read_cbc_solution, run_cbc, solution_result, write_mps)
+
+class ParametricMakespanModel:
+    """The per-panel makespan MILP for a fixed panel count, re-solvable under new parameters.
+
+    Processing times and PM durations only appear in the right-hand side (see
+    matrix_milp.matrix_rhs), so an update rewrites that vector and reuses the
+    formatted constraint matrix. Y is fixed to 1 by PM_Frequency, which makes the
+    LP relaxation exact: every solve runs CBC's dual simplex starting from the
+    basis saved by the previous solve, a valid dual-feasible start for a new RHS.
+    """
+
+    def __init__(self, panels_per_week, processing_time, pm_duration, machines=machines,
+                 available_time=available_time, cbc_path=None, workdir=None):
+        self.machines = list(machines)
+        self.available_time = available_time
+        self.processing_time = dict(processing_time)
+        self.pm_duration = dict(pm_duration)
+        self.cbc_path = cbc_path
+        self.model = build_matrix_model(panels_per_week, self.processing_time, self.pm_duration,
+                                        self.machines, available_time)
+        self._columns_section = format_mps_columns(self.model)
+        self._workdir = tempfile.mkdtemp(prefix="makespan_", dir=workdir)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._workdir, True)
+        self._basis_path = os.path.join(self._workdir, "last.bas")
+        self.solves = 0
+
+    @property
+    def panels_per_week(self):
+        return self.model.panels_per_week
+
+    def update(self, processing_time=None, pm_duration=None):
+        """Change processing times and/or PM durations (partial dicts allowed) in place."""
+        if processing_time:
+            self.processing_time.update(processing_time)
+        if pm_duration:
+            self.pm_duration.update(pm_duration)
+        self.model.rhs[:] = matrix_rhs(self.panels_per_week, self.processing_time, self.pm_duration,
+                                       self.machines, self.available_time)
+
+    def set_processing_time(self, machine, value):
+        self.update(processing_time={machine: value})
+
+    def set_pm_duration(self, machine, value):
+        self.update(pm_duration={machine: value})
+
+    def solve(self, msg=False):
+        """Solve with the current parameters; same result dict as matrix_milp.solve_matrix_milp."""
+        timings = {"build": 0.0}
+        mps_path = os.path.join(self._workdir, "model.mps")
+        solution_path = os.path.join(self._workdir, "model.sol")
+
+        start = time.perf_counter()
+        write_mps(self.model, mps_path, self._columns_section)
+        timings["write"] = time.perf_counter() - start
+
+        args = [mps_path, "-presolve", "off"]
+        if os.path.exists(self._basis_path):
+            args += ["-basisI", self._basis_path]
+        args += ["-dualS", "-basisO", self._basis_path, "-solution", solution_path]
+        start = time.perf_counter()
+        run_cbc(self.cbc_path, args, msg)
+        timings["solve"] = time.perf_counter() - start
+        self.solves += 1
+
+        start = time.perf_counter()
+        status, values = read_cbc_solution(solution_path, self.model.num_columns)
+        timings["read"] = time.perf_counter() - start
+        return solution_result(self.model, self.machines, status, values, timings)
+
+    def close(self):
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+MAX_MODELS = 4  # Models kept per process; each holds its formatted matrix (~14 MB at the weekly panel count)
+_models = OrderedDict()  # Reusable models by panel count, least recently used first
+
+def shared_model(panels_per_week, processing_time, pm_duration, machines=machines,
+                 available_time=available_time):
+    """This process's model for the panel count, updated to the given parameters.
+
+    At most MAX_MODELS panel counts are kept; the least recently used model is
+    closed when another one is built, so a long-lived worker stays bounded.
+    """
+    model = _models.pop(panels_per_week, None)
+    if model is None or model.machines != list(machines) or model.available_time != available_time:
+        if model is not None:
+            model.close()
+        model = ParametricMakespanModel(panels_per_week, processing_time, pm_duration, machines, available_time)
+        while len(_models) >= MAX_MODELS:
+            _models.popitem(last=False)[1].close()
+    else:
+        model.update(processing_time, pm_duration)
+    _models[panels_per_week] = model
+    return model
+
+def solve_makespan(panels_per_week, processing_time, pm_duration):
+    """Optimal makespan in hours, or None if infeasible, reusing the model for this panel count."""
+    result = shared_model(panels_per_week, processing_time, pm_duration).solve()
+    if result["status"] == "Optimal":
+        return result["makespan"] / 3600  # Convert seconds to hours
+    return None
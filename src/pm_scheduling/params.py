@@ -0,0 +1,14 @@
+# Base-case parameters shared by the MILP formulations and the backends built on them
+panels_per_week = 15294  # Weekly production target
+processing_time = {  # Processing times in seconds
+    "Grinder": 18.00,
+    "VTD": 18.79,
+    "CHT": 34.95
+}
+pm_duration = {  # Preventive maintenance durations in seconds
+    "Grinder": 3 * 3600,
+    "VTD": 2 * 3600,
+    "CHT": 1.5 * 3600
+}
+available_time = 7 * 24 * 3600  # Total available time in seconds
+machines = ["Grinder", "VTD", "CHT"]  # Machine names, in route order
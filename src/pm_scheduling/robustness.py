@@ -0,0 +1,252 @@
+# Monte Carlo robustness of a fixed schedule under stochastic processing and PM times
+import sys
+import numpy as np
+from .milp_solver import available_time, machines, panels_per_week, pm_duration, processing_time
+
+SCENARIOS = 1000
+CHUNK = 128  # Scenarios simulated per batch; bounds memory at a few (CHUNK, panels) arrays
+SHIFT_LENGTH = 8 * 3600  # Processing times are redrawn every shift
+PROCESSING_CV = {"Grinder": 0.05, "VTD": 0.05, "CHT": 0.10}  # Coefficient of variation of the shift cycle time
+PM_DURATION_CV = {"Grinder": 0.2, "VTD": 0.2, "CHT": 0.2}
+PERCENTILES = (50, 90, 95, 99)
+FITNESS_SCENARIOS = 64
+FITNESS_QUANTILE = 95
+
+def milp_sequences(completion_times):
+    """Panel order (0-based) per machine, shape (machines, panels), from a completion time matrix."""
+    return np.argsort(np.asarray(completion_times), axis=0, kind="stable").T
+
+def chromosome_sequences(chromosome):
+    """Panel order (0-based) per machine of a GA chromosome, shape (machines, panels).
+
+    Only chromosomes that run every panel once per machine are schedules, i.e.
+    those of the "jox" operators.
+    """
+    sequences = [chromosome.panels[chromosome.machines == k] for k in range(len(machines))]
+    if len({len(sequence) for sequence in sequences}) != 1:
+        raise ValueError("chromosome does not run every panel on every machine (use operators='jox')")
+    return np.stack(sequences).astype(np.intp) - 1
+
+def lognormal(rng, mean, cv, size):
+    """Lognormal samples with the given mean and coefficient of variation."""
+    sigma = np.sqrt(np.log1p(cv ** 2))
+    return rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, size)
+
+def sample_factors(rng, count, shifts, processing_cv=PROCESSING_CV, pm_cv=PM_DURATION_CV):
+    """Multipliers of the nominal times: (count, machines, shifts) for processing, (count, machines) for PM."""
+    processing = np.stack([lognormal(rng, 1.0, processing_cv[m], (count, shifts)) for m in machines], axis=1)
+    pm = np.stack([lognormal(rng, 1.0, pm_cv[m], count) for m in machines], axis=1)
+    return processing, pm
+
+def shift_count(panels, processing_time=processing_time, shift_length=SHIFT_LENGTH):
+    """Shifts covered by the slowest machine's nominal workload."""
+    return int(panels * max(processing_time.values()) // shift_length) + 1
+
+def machine_timelines(processing_factors, panels, processing_time=processing_time, shift_length=SHIFT_LENGTH):
+    """Processing done by and before each position, per machine: (busy, before) arrays of shape (scenarios, panels).
+
+    An operation in shift ``s`` (taken from its nominal start, position times
+    processing time) lasts ``processing_time * processing_factors[:, machine, s]``.
+    The timelines depend on positions only, not on the schedule, so every
+    schedule simulated on the same draws shares them.
+    """
+    positions = np.arange(panels)
+    timelines = []
+    for k, m in enumerate(machines):
+        p = processing_time[m]
+        shift = np.minimum((positions * p // shift_length).astype(np.intp), processing_factors.shape[2] - 1)
+        durations = p * processing_factors[:, k].take(shift, axis=1)  # C order, unlike [:, k, shift]
+        busy = np.cumsum(durations, axis=1)
+        timelines.append((busy, busy - durations))
+    return timelines
+
+def simulate(sequences, processing_factors, pm_factors, processing_time=processing_time, pm_duration=pm_duration,
+             pm_thresholds=None, shift_length=SHIFT_LENGTH):
+    """Makespans and PM start/end times (seconds) of one schedule in every sampled scenario.
+
+    ``sequences`` is one schedule (machines, panels), or a batch of them
+    (rows, machines, panels), in which case every result gains a leading rows
+    axis. See machine_timelines for the processing times and
+    simulate_timelines for the schedule.
+    """
+    timelines = machine_timelines(processing_factors, sequences.shape[-1], processing_time, shift_length)
+    return simulate_timelines(sequences, timelines, pm_factors, pm_duration, pm_thresholds)
+
+def simulate_timelines(sequences, timelines, pm_factors, pm_duration=pm_duration, pm_thresholds=None):
+    """simulate for precomputed machine_timelines.
+
+    Each machine runs its ``sequences`` row in order. As in
+    ga_solver.schedule_population, the recurrence ``C[t] = max(C[t-1], ready[t]) + p[t]``
+    becomes ``C = P + running max(ready - P + p)`` with ``P`` the cumulative
+    processing time, so all schedules and scenarios run as one array
+    computation. The PM goes before the first operation the machine reaches
+    at or after ``pm_thresholds[machine]`` (default: after the last one). The
+    makespan is the completion of the last operation, as in the MILP: a PM
+    inserted mid-production delays it, a PM after the last operation does not
+    (its times are in the PM start/end results). Panels are identical, so the first
+    machine's times do not depend on its order and are simulated once for
+    all rows.
+    """
+    single = sequences.ndim == 2
+    sequences = sequences[None] if single else sequences
+    rows, _, panels = sequences.shape
+    count = len(pm_factors)
+    positions = np.arange(panels)
+    previous = None  # Position of each panel in the previous machine's sequence, per row
+    makespans = np.zeros((rows, count))
+    pm_start = np.empty((rows, count, len(machines)))
+    pm_end = np.empty((rows, count, len(machines)))
+    for k, m in enumerate(machines):
+        busy, before = timelines[k]
+        if previous is None:
+            slack = -before[None]  # One row standing for all of them
+        else:  # Ready at the panel's completion on the previous machine; no gather for a permutation schedule
+            ready_order = np.take_along_axis(previous, sequences[:, k], axis=1)
+            slack = np.empty((rows, count, panels))
+            for r in range(rows):
+                ready = done[r if len(done) > 1 else 0]
+                if np.array_equal(ready_order[r], positions):
+                    slack[r] = ready
+                else:
+                    ready.take(ready_order[r], axis=1, out=slack[r])
+            slack -= before
+        np.maximum(slack[..., 0], 0.0, out=slack[..., 0])  # The machine is free from time 0
+        running = np.maximum.accumulate(slack, axis=-1)
+        done = busy + running
+
+        # PM before operation `split`: the machine is free at done[split - 1] (0 for the first).
+        # Completion times increase along a sequence, so only the second-to-last one decides whether it is reached
+        threshold = np.inf if pm_thresholds is None else pm_thresholds[m]
+        split = np.zeros(done.shape[:2], dtype=np.intp)
+        if threshold <= 0:
+            reached = np.ones(done.shape[:2], dtype=bool)
+        else:
+            reached = done[..., -2] >= threshold if panels > 1 else np.zeros(done.shape[:2], dtype=bool)
+            for r, c in zip(*np.nonzero(reached)):
+                split[r, c] = np.searchsorted(done[r, c, :-1], threshold) + 1
+        length = pm_duration[m] * pm_factors[:, k]
+        last = np.take_along_axis(done, np.maximum(split - 1, 0)[..., None], axis=-1)[..., 0]
+        start = np.where(reached, np.where(split > 0, last, 0.0), done[..., -1])
+        r, c = np.nonzero(reached)
+        if len(r):
+            s = split[r, c]
+            slack[r, c, s] = np.maximum(slack[r, c, s], start[r, c] + length[c] - before[c, s])
+            # Only the running maximum from the earliest PM on changes
+            low = int(s.min())
+            tail = np.maximum.accumulate(slack[..., low:], axis=-1)
+            if low > 0:
+                np.maximum(tail, running[..., low - 1:low], out=tail)
+            done[..., low:] = busy[:, low:] + tail
+
+        pm_start[..., k], pm_end[..., k] = start, start + length
+        np.maximum(makespans, done[..., -1], out=makespans)
+        previous = np.empty((rows, panels), dtype=np.intp)
+        np.put_along_axis(previous, sequences[:, k], np.broadcast_to(positions, (rows, panels)), axis=1)
+    if single:
+        return makespans[0], pm_start[0], pm_end[0]
+    return makespans, pm_start, pm_end
+
+def default_pm_bounds(pm_duration=pm_duration, available_time=available_time):
+    """PM windows of the MILP: start at or after 0 and end within the net available time."""
+    net_available_time = available_time - sum(pm_duration.values())
+    return {m: (0.0, net_available_time) for m in machines}
+
+def evaluate_robustness(sequences, scenarios=SCENARIOS, processing_time=processing_time, pm_duration=pm_duration,
+                        pm_thresholds=None, pm_bounds=None, processing_cv=PROCESSING_CV, pm_cv=PM_DURATION_CV,
+                        shift_length=SHIFT_LENGTH, seed=None, chunk=CHUNK):
+    """Makespan percentiles (hours) and PM-window violation rates of a schedule over sampled scenarios.
+
+    ``sequences`` comes from milp_sequences or chromosome_sequences.
+    ``pm_bounds`` maps each machine to the (earliest start, latest end) of its
+    PM in seconds (default_pm_bounds). Scenarios are simulated ``chunk`` at a
+    time. For a MILP schedule the nominal makespan is the MILP makespan plus
+    one Grinder processing time: the MILP's Start_Grinder constraint lets the
+    first Grinder operation complete at time 0.
+    """
+    rng = np.random.default_rng(seed)
+    pm_bounds = default_pm_bounds(pm_duration) if pm_bounds is None else pm_bounds
+    shifts = shift_count(sequences.shape[1], processing_time, shift_length)
+    earliest = np.array([pm_bounds[m][0] for m in machines])
+    latest = np.array([pm_bounds[m][1] for m in machines])
+    makespans = np.empty(scenarios)
+    violations = np.empty((scenarios, len(machines)), dtype=bool)
+    for first in range(0, scenarios, chunk):
+        count = min(chunk, scenarios - first)
+        processing_factors, pm_factors = sample_factors(rng, count, shifts, processing_cv, pm_cv)
+        span, start, end = simulate(sequences, processing_factors, pm_factors, processing_time, pm_duration,
+                                    pm_thresholds, shift_length)
+        makespans[first:first + count] = span
+        violations[first:first + count] = (start < earliest) | (end > latest)
+    nominal, _, _ = simulate(sequences, np.ones((1, len(machines), shifts)), np.ones((1, len(machines))),
+                             processing_time, pm_duration, pm_thresholds, shift_length)
+    return {
+        "scenarios": scenarios,
+        "nominal_makespan": float(nominal[0]) / 3600,
+        "mean_makespan": float(makespans.mean()) / 3600,
+        "std_makespan": float(makespans.std()) / 3600,
+        "makespan_percentiles": {q: float(v) / 3600 for q, v in zip(PERCENTILES, np.percentile(makespans, PERCENTILES))},
+        "pm_violation_rate": {m: float(rate) for m, rate in zip(machines, violations.mean(axis=0))},
+        "any_violation_rate": float(violations.any(axis=1).mean()),
+    }
+
+class RobustFitness:
+    """GA fitness term: a makespan quantile over a fixed set of sampled scenarios.
+
+    The scenarios are drawn once (common random numbers), so chromosomes are
+    compared on the same draws and a chromosome always gets the same score.
+    The machine timelines are computed once as well, from the processing times
+    at construction. Calling an instance scores a list of chromosomes
+    ``batch`` at a time through simulate_timelines and returns the scores and
+    the mean PM end per machine in hours, like ga_solver's evaluators. Pass it
+    as ``robustness`` to ga_solver.genetic_algorithm, which uses it in place
+    of the nominal evaluation, together with the GA's model:
+    ``processing_time``, ``pm_duration`` and the live ``milp_pm_times_sec`` as
+    ``pm_thresholds`` (see ga_fitness).
+    """
+
+    def __init__(self, panels, scenarios=FITNESS_SCENARIOS, quantile=FITNESS_QUANTILE,
+                 processing_time=processing_time, pm_duration=pm_duration, pm_thresholds=None,
+                 processing_cv=PROCESSING_CV, pm_cv=PM_DURATION_CV, shift_length=SHIFT_LENGTH, seed=0, batch=None):
+        self.quantile = quantile
+        self.pm_duration = pm_duration
+        self.pm_thresholds = pm_thresholds
+        self.batch = batch or max(1, CHUNK // scenarios)  # Chromosomes per batch, as many scenarios as CHUNK
+        shifts = shift_count(panels, processing_time, shift_length)
+        processing_factors, self.pm_factors = sample_factors(np.random.default_rng(seed), scenarios, shifts,
+                                                             processing_cv, pm_cv)
+        self.timelines = machine_timelines(processing_factors, panels, processing_time, shift_length)
+
+    def __call__(self, population):
+        scores = np.empty(len(population))
+        pm_matrix = np.empty((len(population), len(machines)))
+        for first in range(0, len(population), self.batch):
+            rows = slice(first, first + self.batch)
+            sequences = np.stack([chromosome_sequences(chromosome) for chromosome in population[rows]])
+            makespans, _, pm_end = simulate_timelines(sequences, self.timelines, self.pm_factors, self.pm_duration,
+                                                      self.pm_thresholds)
+            scores[rows] = np.percentile(makespans, self.quantile, axis=1)
+            pm_matrix[rows] = pm_end.mean(axis=1) / 3600
+        return scores, pm_matrix
+
+def ga_fitness(panels, **options):
+    """RobustFitness for the GA's own model: its processing times, PM duration and PM thresholds."""
+    from . import ga_solver
+    return RobustFitness(panels, processing_time=ga_solver.processing_time,
+                         pm_duration={m: ga_solver.pm_duration_sec for m in machines},
+                         pm_thresholds=ga_solver.milp_pm_times_sec, **options)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    scenarios = int(argv[0]) if len(argv) > 0 else SCENARIOS
+    from .flow_shop import solve_fast
+    milp = solve_fast(panels_per_week, processing_time, pm_duration, machines, available_time)
+    report = evaluate_robustness(milp_sequences(milp["completion_times"]), scenarios, seed=0)
+    print(f"MILP schedule over {scenarios} scenarios: nominal makespan {report['nominal_makespan']:.2f} hours, "
+          f"mean {report['mean_makespan']:.2f} hours")
+    for q, value in report["makespan_percentiles"].items():
+        print(f"  P{q}: {value:.2f} hours")
+    for m, rate in report["pm_violation_rate"].items():
+        print(f"Machine {m}: PM window violated in {rate:.1%} of scenarios")
+
+if __name__ == "__main__":
+    main()
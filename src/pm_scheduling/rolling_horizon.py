@@ -0,0 +1,139 @@
+# Rolling-horizon planning over several weeks with the lot-based MILP
+import sys
+import time
+from .lot_milp import LOT_SIZE, build_lot_model, make_lots
+from .params import available_time, machines, panels_per_week, pm_duration, processing_time
+
+week_length = available_time  # Seconds per planning window
+PM_INTERVAL = week_length  # Each PM must end at most this long after the previous one ended
+PM_WINDOW = 2 * 24 * 3600  # ...and may start at most this long before that deadline
+WEEKS = 4
+
+def _warm_start(variables, previous, offset, shift):
+    """Seed S/E with the previous window's values for the same lots.
+
+    Lot ``j`` of this window is lot ``j + offset`` of the previous one: with
+    overlap that is the same lookahead lot (``shift`` 0), otherwise the same
+    position one week earlier (``shift`` one week). Lots without a matching
+    size get no start value and CBC completes the rest. Without overlap the
+    PM placement and makespan are copied too, which gives CBC a complete
+    incumbent whenever the same machines need a PM as in the previous week.
+    """
+    lots, previous_lots = variables["lots"], previous["lots"]
+    for j, q in enumerate(lots):
+        source = j + offset
+        if source >= len(previous_lots) or previous_lots[source] != q:
+            continue
+        moved = 0.0 if source >= previous["committed"] else shift
+        for m in machines:
+            for name in ("S", "E"):
+                value = previous["values"][name][(source, m)]
+                if value is not None:
+                    variables[name][(j, m)].setInitialValue(value + moved)
+    if offset == 0 and len(lots) == len(previous_lots):
+        for key, variable in variables["X"].items():
+            variable.setInitialValue(round(previous["values"]["X"][key]))
+        variables["C_max"].setInitialValue(previous["values"]["C_max"] + shift)
+
+def rolling_horizon(weeks=WEEKS, panels_per_week=panels_per_week, processing_time=processing_time,
+                    pm_duration=pm_duration, lot_size=LOT_SIZE, overlap=0.0, pm_interval=PM_INTERVAL,
+                    pm_window=PM_WINDOW, warm_start=True, msg=False):
+    """Plan ``weeks`` weeks one window at a time; returns the schedule and per-window results.
+
+    ``panels_per_week`` is a weekly target or a list of them. Each window holds
+    one week's panels, released at the start of that week (a PM may use the
+    idle time before), plus with
+    ``overlap`` (0 <= overlap < 1) a lookahead of that fraction of the next
+    week's panels. Only the first week is committed. The machine ready times
+    (last panel or PM on each machine) carry over between windows. So do the PM
+    deadlines: a PM must end by ``pm_interval`` after the previous PM on that
+    machine ended, and the first by the net available time of the first week,
+    as in the single-week model. Later PMs may start at most ``pm_window``
+    before their deadline, which keeps them roughly ``pm_interval`` apart. A PM
+    is scheduled in the window whose horizon contains its deadline. Every window has the same size, so runtime grows
+    linearly with the number of weeks.
+    All times are absolute seconds since the start of the first week.
+    """
+    import pulp
+    if not 0 <= overlap < 1:
+        raise ValueError("overlap must be in [0, 1)")
+    targets = list(panels_per_week) if isinstance(panels_per_week, (list, tuple)) else [panels_per_week] * weeks
+    deadline = {m: week_length - sum(pm_duration.values()) for m in machines}
+    earliest = {m: 0.0 for m in machines}
+    ready = None  # First week: same start conditions as the single-week model
+    pm_starts = {m: [] for m in machines}
+    windows = []
+    previous = None
+
+    for week, target in enumerate(targets):
+        window_start = week * week_length
+        lots = make_lots(target, lot_size)
+        committed = len(lots)
+        lookahead = int(round(overlap * targets[week + 1])) if week + 1 < len(targets) else 0
+        lot_release = {0: window_start} if week > 0 else {}
+        if lookahead:
+            lot_release[committed] = window_start + week_length
+            lots = lots + make_lots(lookahead, lot_size)
+        window_end = window_start + week_length * (1 + (overlap if lookahead else 0))
+        pm_windows = {m: 1 if deadline[m] <= window_end else 0 for m in machines}
+
+        model, variables = build_lot_model(sum(lots), processing_time, pm_duration, lot_size, pm_windows,
+                                           available_time=window_start + week_length, lots=lots,
+                                           ready_time=ready, pm_deadline=deadline, pm_earliest=earliest,
+                                           lot_release=lot_release)
+        if warm_start and previous is not None:
+            _warm_start(variables, previous, previous["committed"] if previous["lookahead"] else 0,
+                        week_length)
+        start = time.perf_counter()
+        model.solve(pulp.PULP_CBC_CMD(msg=msg, warmStart=warm_start and previous is not None))
+        seconds = time.perf_counter() - start
+        status = pulp.LpStatus[model.status]
+        window = {"week": week, "status": status, "panels": target, "lookahead_panels": lookahead,
+                  "solve_seconds": seconds, "pm_starts": {m: [] for m in machines}}
+        windows.append(window)
+        if status != "Optimal":
+            return {"status": status, "makespan": None, "pm_starts": pm_starts, "windows": windows}
+
+        # Commit the first week: its lots and any PM up to the boundary after its last lot
+        S, E, X, T_PM = variables["S"], variables["E"], variables["X"], variables["T_PM"]
+        ready = {m: pulp.value(E[(committed - 1, m)]) for m in machines}
+        for m in machines:
+            for b in range(committed + 1):
+                if pulp.value(X[(b, m)]) > 0.5:
+                    start_time = pulp.value(T_PM[(b, m)])
+                    end_time = start_time + pm_duration[m]
+                    pm_starts[m].append(start_time)
+                    window["pm_starts"][m].append(start_time)
+                    deadline[m] = end_time + pm_interval
+                    earliest[m] = deadline[m] - pm_window
+                    ready[m] = max(ready[m], end_time)
+        window["end"] = pulp.value(E[(committed - 1, machines[-1])])  # Last committed panel
+        previous = {
+            "lots": variables["lots"],
+            "committed": committed,
+            "lookahead": bool(lookahead),
+            "values": {**{name: {key: variable.varValue for key, variable in variables[name].items()}
+                          for name in ("S", "E", "X")},
+                       "C_max": variables["C_max"].varValue},
+        }
+
+    return {"status": "Optimal", "makespan": windows[-1]["end"], "pm_starts": pm_starts, "windows": windows}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    weeks = int(argv[0]) if len(argv) > 0 else WEEKS
+    overlap = float(argv[1]) if len(argv) > 1 else 0.0
+    result = rolling_horizon(weeks, overlap=overlap)
+    for window in result["windows"]:
+        end = f", last panel at {window['end'] / 3600:.2f} hours" if "end" in window else ""
+        print(f"Week {window['week'] + 1}: {window['status']}, solved in {window['solve_seconds']:.2f} s{end}")
+    if result["status"] == "Optimal":
+        print(f"Horizon Makespan: {result['makespan'] / 3600:.2f} hours")
+        for m in machines:
+            starts = ", ".join(f"{t / 3600:.2f}" for t in result["pm_starts"][m])
+            print(f"Machine {m}: PM Start Times = {starts} hours")
+    else:
+        print("No optimal solution found.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Parallel scenario sweeps with a content-addressed on-disk result cache
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from .parametric_model import shared_model
+from .data import RESULT_DIR
+from .matrix_milp import available_time, machines
+
+MODEL_VERSION = 1  # Bump when the formulation changes so cached results are not reused
+CACHE_DIR = os.path.join(RESULT_DIR, "sweep_cache")
+
+def make_scenario(panels_per_week, processing_time, pm_duration, machines=machines,
+                  available_time=available_time):
+    """A self-contained, JSON-serializable scenario; the dicts are copied, never shared."""
+    return {
+        "panels_per_week": int(panels_per_week),
+        "processing_time": {m: float(processing_time[m]) for m in machines},
+        "pm_duration": {m: float(pm_duration[m]) for m in machines},
+        "machines": list(machines),
+        "available_time": float(available_time),
+    }
+
+def expand_grid(base, axes):
+    """Scenarios for the Cartesian product of `axes` applied to the `base` scenario.
+
+    `axes` maps a parameter to its values: "panels_per_week", or a
+    ("processing_time" | "pm_duration", machine) pair.
+    """
+    names = list(axes)
+    scenarios = []
+    for values in itertools.product(*(axes[name] for name in names)):
+        scenario = json.loads(json.dumps(base))  # Deep copy
+        for name, value in zip(names, values):
+            if isinstance(name, tuple):
+                scenario[name[0]][name[1]] = float(value)
+            else:
+                scenario[name] = type(scenario[name])(value)
+        scenarios.append(scenario)
+    return scenarios
+
+def scenario_key(scenario):
+    """SHA-256 of the canonical JSON of every solver input plus the model version."""
+    payload = json.dumps({"model_version": MODEL_VERSION, **scenario}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ResultCache:
+    """One JSON file per scenario key, written atomically so concurrent sweeps never see partial files."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+
+def solve_scenario(scenario):
+    """Solve one scenario; each worker keeps a warm-started model per panel count."""
+    model = shared_model(scenario["panels_per_week"], scenario["processing_time"], scenario["pm_duration"],
+                         scenario["machines"], scenario["available_time"])
+    result = model.solve()
+    return {
+        "status": result["status"],
+        "makespan": result["makespan"] if result["status"] == "Optimal" else None,
+        "pm_start": result["pm_start"] if result["status"] == "Optimal" else None,
+    }
+
+def run_sweep(scenarios, workers=None, cache=None, verbose=False):
+    """Solve `scenarios` and return their results in input order.
+
+    Identical scenarios are solved once, results already in `cache` (default: a
+    ResultCache under result/sweep_cache, pass False to disable) are reused, and
+    the rest run concurrently in at most `workers` processes, each driving one
+    CBC subprocess at a time. Scenarios are sorted by panel count so a worker's
+    consecutive solves can warm-start from the same model.
+    """
+    if cache is None:
+        cache = ResultCache()
+    keys = [scenario_key(scenario) for scenario in scenarios]
+    unique = dict(zip(keys, scenarios))
+    results = {}
+    if cache:
+        for key in unique:
+            cached = cache.get(key)
+            if cached is not None:
+                results[key] = cached
+    pending = sorted((key for key in unique if key not in results),
+                     key=lambda key: unique[key]["panels_per_week"])
+
+    if pending:
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+        if workers == 1:
+            solved = map(solve_scenario, (unique[key] for key in pending))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            chunksize = max(1, len(pending) // (4 * workers))
+            solved = executor.map(solve_scenario, (unique[key] for key in pending), chunksize=chunksize)
+        try:
+            for key, result in zip(pending, solved):
+                results[key] = result
+                if cache:
+                    cache.put(key, result)
+        finally:
+            if workers > 1:
+                executor.shutdown()
+
+    if verbose:
+        print(f"Sweep: {len(scenarios)} scenarios, {len(unique)} unique, "
+              f"{len(unique) - len(pending)} cached, {len(pending)} solved")
+    return [results[key] for key in keys]
@@ -0,0 +1,123 @@
+# Columnar schedule export: one row per operation, memory-mappable .npy columns or Parquet
+import json
+import os
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: only needed for the Parquet format
+    pa = pq = None
+
+CHUNK_ROWS = 1 << 16  # Rows per write; also the Parquet row group size
+COLUMNS = {  # Column name -> dtype
+    "panel": np.uint32,
+    "machine": np.uint8,  # Index into the "machines" metadata list
+    "completion_time": np.float64,  # Seconds
+}
+METADATA_FILE = "schedule.json"
+
+class ScheduleWriter:
+    """Stream schedule rows to disk chunk by chunk.
+
+    ``fmt="npy"`` writes ``path`` as a directory holding one .npy file per column
+    plus schedule.json; ``fmt="parquet"`` writes a single Parquet file with the
+    same columns and the metadata in the file footer. Call ``write`` with column
+    arrays of any length, then ``close`` with the per-machine PM starts.
+    """
+
+    def __init__(self, path, rows, machines, fmt="npy"):
+        self.path = path
+        self.rows = rows
+        self.machines = list(machines)
+        self.fmt = fmt
+        self.offset = 0
+        if fmt == "npy":
+            os.makedirs(path, exist_ok=True)
+            self.columns = {name: np.lib.format.open_memmap(os.path.join(path, name + ".npy"), mode="w+",
+                                                            dtype=dtype, shape=(rows,))
+                            for name, dtype in COLUMNS.items()}
+        elif fmt == "parquet":
+            if pq is None:
+                raise ImportError("fmt='parquet' requires the pyarrow package")
+            self.schema = pa.schema([(name, pa.from_numpy_dtype(dtype)) for name, dtype in COLUMNS.items()])
+            self.writer = pq.ParquetWriter(path + ".tmp", self.schema)
+        else:
+            raise ValueError(f"Unknown schedule format: {fmt!r}")
+
+    def write(self, panel, machine, completion_time):
+        """Append rows; large inputs are split into CHUNK_ROWS pieces."""
+        for start in range(0, len(panel), CHUNK_ROWS):
+            chunk = {
+                "panel": panel[start:start + CHUNK_ROWS],
+                "machine": machine[start:start + CHUNK_ROWS],
+                "completion_time": completion_time[start:start + CHUNK_ROWS],
+            }
+            stop = self.offset + len(chunk["panel"])
+            if self.fmt == "npy":
+                for name, values in chunk.items():
+                    self.columns[name][self.offset:stop] = values
+            else:
+                arrays = [pa.array(np.asarray(chunk[name], dtype=dtype)) for name, dtype in COLUMNS.items()]
+                self.writer.write_batch(pa.record_batch(arrays, schema=self.schema), row_group_size=CHUNK_ROWS)
+            self.offset = stop
+
+    def close(self, pm_start, makespan, source):
+        """Finish the file; ``pm_start`` maps machine to PM start (seconds)."""
+        if self.offset != self.rows:
+            raise ValueError(f"Expected {self.rows} rows, got {self.offset}")
+        metadata = {
+            "source": source,
+            "machines": self.machines,
+            "rows": self.rows,
+            "makespan": float(makespan),
+            "pm_start": {m: float(pm_start[m]) for m in self.machines},
+            "units": "seconds",
+        }
+        if self.fmt == "npy":
+            for column in self.columns.values():
+                column.flush()
+            self.columns = None
+            with open(os.path.join(self.path, METADATA_FILE), "w") as f:
+                json.dump(metadata, f, indent=2)
+        else:
+            self.writer.add_key_value_metadata({"schedule": json.dumps(metadata)})
+            self.writer.close()
+            os.replace(self.path + ".tmp", self.path)  # Readers never see a half-written file
+        return metadata
+
+def write_schedule(path, panel, machine, completion_time, pm_start, makespan, machines, source, fmt="npy"):
+    """Write a whole schedule in one call; returns its metadata."""
+    writer = ScheduleWriter(path, len(panel), machines, fmt)
+    writer.write(panel, machine, completion_time)
+    return writer.close(pm_start, makespan, source)
+
+def read_schedule(path):
+    """Load a schedule written by ScheduleWriter; returns (columns dict, metadata).
+
+    The .npy columns are memory-mapped read-only and Parquet files are memory-mapped
+    through Arrow, so a week's schedule is not copied into Python objects.
+    """
+    if os.path.isdir(path):
+        with open(os.path.join(path, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        columns = {name: np.load(os.path.join(path, name + ".npy"), mmap_mode="r") for name in COLUMNS}
+        return columns, metadata
+    if pq is None:
+        raise ImportError("Reading Parquet schedules requires the pyarrow package")
+    table = pq.read_table(path, memory_map=True)
+    metadata = json.loads(pq.read_metadata(path).metadata[b"schedule"])
+    columns = {name: table.column(name).to_numpy() for name in COLUMNS}
+    return columns, metadata
+
+def export_milp_schedule(path, completion_times, pm_start, makespan, machines, fmt="npy", source="milp"):
+    """Export a (panels, machines) completion time matrix; rows are panel-major as in the MILP."""
+    panels, num_machines = completion_times.shape
+    panel = np.repeat(np.arange(1, panels + 1, dtype=np.uint32), num_machines)
+    machine = np.tile(np.arange(num_machines, dtype=np.uint8), panels)
+    return write_schedule(path, panel, machine, completion_times.ravel(), pm_start, makespan, machines, source, fmt)
+
+def export_ga_schedule(path, chromosome, completion_times, pm_start, makespan, machines, fmt="npy", source="ga"):
+    """Export a GA chromosome (operation order) with the completion time of each operation."""
+    return write_schedule(path, chromosome.panels, chromosome.machines, completion_times, pm_start, makespan,
+                          machines, source, fmt)
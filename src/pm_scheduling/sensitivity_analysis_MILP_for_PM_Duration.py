@@ -0,0 +1,58 @@
+# Sensitivity analysis of MILP for PM Duration
+from .scenario_sweep import make_scenario, run_sweep 
+ 
+# Constants 
+panels_per_week = 15294  # Weekly production target 
+processing_time = {  # Processing times in seconds 
+    "Grinder": 18.00, 
+    "VTD": 18.79, 
+    "CHT": 34.95 
+} 
+available_time = 7 * 24 * 3600  # Total available time in seconds 
+machines = ["Grinder", "VTD", "CHT"]  # Machine names 
+ 
+# Perform sensitivity analysis for PM Duration 
+def sensitivity_analysis_pm_duration(machine, pm_durations, workers=None): 
+    original_pm_duration = { 
+        "Grinder": 3.0 * 3600, 
+        "VTD": 2.0 * 3600, 
+        "CHT": 1.5 * 3600 
+    } 
+    scenarios = [] 
+    for duration in pm_durations: 
+        pm_duration = original_pm_duration.copy() 
+        pm_duration[machine] = duration  # Update PM duration for the specific machine 
+        scenarios.append(make_scenario(panels_per_week, processing_time, pm_duration, machines, available_time)) 
+    results = [] 
+    for duration, result in zip(pm_durations, run_sweep(scenarios, workers=workers)): 
+        results.append({ 
+            "Machine": machine, 
+            "PM_Duration (hours)": duration / 3600,  # Convert seconds to hours 
+            "Makespan (hours)": result["makespan"] / 3600 if result["makespan"] is not None else None 
+        }) 
+    return results 
+ 
+ 
+# Define PM duration ranges for each machine 
+grinder_pm_durations = [2.5 * 3600, 3.0 * 3600, 3.5 * 3600] 
+vtd_pm_durations = [1.5 * 3600, 2.0 * 3600, 2.5 * 3600] 
+cht_pm_durations = [1.0 * 3600, 1.5 * 3600, 2.0 * 3600] 
+ 
+def main(argv=None): 
+    # Perform sensitivity analysis for each machine 
+    grinder_results = sensitivity_analysis_pm_duration("Grinder", 
+    grinder_pm_durations) 
+    vtd_results = sensitivity_analysis_pm_duration("VTD", vtd_pm_durations) 
+    cht_results = sensitivity_analysis_pm_duration("CHT", cht_pm_durations) 
+ 
+    # Print results 
+    print("Sensitivity Analysis for PM Duration:") 
+    for result in grinder_results: 
+        print(f"Machine: {result['Machine']}, PM Duration: {result['PM_Duration (hours)']} hours, Makespan: {result['Makespan (hours)']} hours") 
+    for result in vtd_results: 
+        print(f"Machine: {result['Machine']}, PM Duration: {result['PM_Duration (hours)']} hours, Makespan: {result['Makespan (hours)']} hours") 
+    for result in cht_results: 
+        print(f"Machine: {result['Machine']}, PM Duration: {result['PM_Duration (hours)']} hours, Makespan: {result['Makespan (hours)']} hours")
+
+if __name__ == "__main__": 
+    main()
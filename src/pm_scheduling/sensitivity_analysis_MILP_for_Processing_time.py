@@ -0,0 +1,91 @@
+# Sensitivity analysis of MILP for Processing time
+from .scenario_sweep import make_scenario, run_sweep 
+ 
+# Constants 
+panels_per_week = 15294  # Weekly production target 
+processing_time = {  # Processing times in seconds 
+    "Grinder": 18.00, 
+    "VTD": 18.79, 
+    "CHT": 34.95 
+} 
+pm_duration = {  # Preventive maintenance durations in seconds 
+    "Grinder": 3 * 3600, 
+    "VTD": 2 * 3600, 
+    "CHT": 1.5 * 3600 
+} 
+available_time = 7 * 24 * 3600  # Total available time in seconds 
+machines = ["Grinder", "VTD", "CHT"]  # Machine names 
+ 
+# Perform sensitivity analysis for all machines 
+def sensitivity_analysis_all_machines(parameter_name, parameter_values, workers=None): 
+    # Each scenario gets its own copy of the parameters; the baseline is one more 
+    # scenario of the same sweep, so the result cache solves it only once 
+    baseline = make_scenario(panels_per_week, processing_time, pm_duration, machines, available_time) 
+    scenarios = [] 
+    for value in parameter_values: 
+        scenario_processing_time = dict(processing_time) 
+        scenario_panels = panels_per_week 
+        if parameter_name == "Grinder_Processing_Time": 
+            scenario_processing_time["Grinder"] = value 
+        elif parameter_name == "VTD_Processing_Time": 
+            scenario_processing_time["VTD"] = value 
+        elif parameter_name == "CHT_Processing_Time": 
+            scenario_processing_time["CHT"] = value 
+        elif parameter_name == "Production_Target": 
+            scenario_panels = int(value) 
+        scenarios.append(make_scenario(scenario_panels, scenario_processing_time, pm_duration, machines, 
+                                       available_time)) 
+ 
+    # Solve the baseline and every updated scenario concurrently 
+    solved = run_sweep([baseline] + scenarios, workers=workers) 
+    original_makespan = solved[0]["makespan"] / 3600 if solved[0]["makespan"] is not None else None 
+    results = [] 
+ 
+    for value, result in zip(parameter_values, solved[1:]): 
+        new_makespan = result["makespan"] / 3600 if result["makespan"] is not None else None 
+ 
+        # Calculate deviation from the original makespan 
+        deviation = None 
+        if new_makespan is not None and original_makespan is not None: 
+            deviation = (new_makespan - original_makespan) / original_makespan * 100 
+ 
+        # Store results 
+        results.append({ 
+            "Machine": parameter_name.split("_")[0], 
+            "Parameter_Value": value, 
+            "New_Makespan": new_makespan, 
+            "Deviation (%)": deviation 
+        }) 
+ 
+    return results 
+ 
+# Define ranges for each machine's processing time 
+grinder_values = [15.0, 16.0, 17.0, 18.0, 19.0, 20.0]  # Seconds 
+vtd_values = [16.0, 17.0, 18.0, 19.0, 20.0, 21.0]  # Seconds 
+cht_values = [30.0, 32.0, 34.0, 36.0, 38.0, 40.0]  # Seconds 
+ 
+def main(argv=None): 
+    # Perform sensitivity analysis for Grinder 
+    grinder_results = sensitivity_analysis_all_machines("Grinder_Processing_Time", grinder_values) 
+ 
+    # Perform sensitivity analysis for VTD 
+    vtd_results = sensitivity_analysis_all_machines("VTD_Processing_Time", vtd_values) 
+ 
+    # Perform sensitivity analysis for CHT 
+    cht_results = sensitivity_analysis_all_machines("CHT_Processing_Time", cht_values) 
+ 
+    # Combine and print results 
+    print(f"Sensitivity Analysis for Grinder Processing Time:") 
+    for result in grinder_results: 
+        print(f"Machine: {result['Machine']}, Parameter Value: {result['Parameter_Value']}, New Makespan: {result['New_Makespan']}, Deviation (%): {result['Deviation (%)']}") 
+ 
+    print(f"\nSensitivity Analysis for VTD Processing Time:") 
+    for result in vtd_results: 
+        print(f"Machine: {result['Machine']}, Parameter Value: {result['Parameter_Value']}, New Makespan: {result['New_Makespan']}, Deviation (%): {result['Deviation (%)']}") 
+ 
+    print(f"\nSensitivity Analysis for CHT Processing Time:") 
+    for result in cht_results: 
+        print(f"Machine: {result['Machine']}, Parameter Value: {result['Parameter_Value']}, New Makespan: {result['New_Makespan']}, Deviation (%): {result['Deviation (%)']}")
+
+if __name__ == "__main__": 
+    main()
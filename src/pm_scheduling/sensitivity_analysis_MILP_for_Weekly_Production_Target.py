@@ -0,0 +1,45 @@
+# Sensitivity analysis of MILP for Weekly Production Target
+from .scenario_sweep import make_scenario, run_sweep 
+ 
+# Constants 
+processing_time = {  # Processing times in seconds 
+    "Grinder": 18.00, 
+    "VTD": 18.79, 
+    "CHT": 34.95 
+} 
+pm_duration = {  # Preventive maintenance durations in seconds 
+    "Grinder": 3 * 3600, 
+    "VTD": 2 * 3600, 
+    "CHT": 1.5 * 3600 
+} 
+available_time = 7 * 24 * 3600  # Total available time in seconds 
+machines = ["Grinder", "VTD", "CHT"]  # Machine names 
+ 
+ 
+# Perform sensitivity analysis for Weekly Production Target 
+def sensitivity_analysis_weekly_target(target_values, workers=None): 
+    scenarios = [make_scenario(target, processing_time, pm_duration, machines, available_time) 
+                 for target in target_values] 
+    results = [] 
+    for target, result in zip(target_values, run_sweep(scenarios, workers=workers)): 
+        results.append({ 
+            "Weekly_Production_Target": target, 
+            "Makespan (hours)": result["makespan"] / 3600 if result["makespan"] is not None else None 
+        }) 
+    return results 
+ 
+ 
+# Define range of Weekly Production Target values 
+weekly_target_values = [14000, 14500, 15000, 15294, 16000, 16500] 
+ 
+def main(argv=None): 
+    # Perform sensitivity analysis 
+    sensitivity_results = sensitivity_analysis_weekly_target(weekly_target_values) 
+ 
+    # Print results 
+    print("Sensitivity Analysis for Weekly Production Target:") 
+    for result in sensitivity_results: 
+        print(f"Weekly Production Target: {result['Weekly_Production_Target']}, Makespan (hours): {result['Makespan (hours)']}")
+
+if __name__ == "__main__": 
+    main()
@@ -0,0 +1,38 @@
+# Agreement of the makespan backends on a small instance: closed form, PuLP/CBC, matrix MPS and parametric
+import pytest
+
+pytest.importorskip("pulp")  # CBC ships with PuLP
+
+from pm_scheduling.flow_shop import solve_fast
+from pm_scheduling.matrix_milp import solve_matrix_milp
+from pm_scheduling.milp_solver import (available_time, cross_check, machines, pm_duration, processing_time,
+                                       solve_milp)
+from pm_scheduling.parametric_model import solve_makespan
+
+PANELS = 50
+
+SCENARIOS = [
+    (processing_time, pm_duration),
+    ({**processing_time, "CHT": 30.0}, pm_duration),
+    ({**processing_time, "Grinder": 40.0}, {**pm_duration, "VTD": 4 * 3600}),
+    (processing_time, {m: 3 * 24 * 3600 for m in machines}),  # PMs do not fit in the week: infeasible
+]
+
+def test_cross_check():
+    cbc, fast = cross_check(PANELS)
+    assert cbc == pytest.approx(fast)
+
+@pytest.mark.parametrize("times, durations", SCENARIOS)
+def test_backends_agree(times, durations):
+    fast = solve_fast(PANELS, times, durations, machines, available_time)
+    cbc = solve_milp(PANELS, times, durations)
+    matrix = solve_matrix_milp(PANELS, times, durations)
+    parametric = solve_makespan(PANELS, times, durations)
+
+    assert cbc["status"] == matrix["status"] == fast["status"]
+    if fast["status"] != "Optimal":
+        assert parametric is None
+        return
+    assert cbc["makespan"] == pytest.approx(fast["makespan"])
+    assert matrix["makespan"] == pytest.approx(fast["makespan"])
+    assert parametric * 3600 == pytest.approx(fast["makespan"])
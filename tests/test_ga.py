@@ -0,0 +1,93 @@
+# GA fitness engines against their reference implementations, and reproducibility of seeded runs
+import random
+
+import numpy as np
+import pytest
+
+from pm_scheduling import ga_solver
+from pm_scheduling.ga_solver import (breed, calculate_makespan_and_pm, encode_population, evaluate_counts,
+                                     evaluate_population, fitness_parameters, genetic_algorithm,
+                                     initialize_population, machines, population_counts, resume_genetic_algorithm,
+                                     schedule_population)
+
+PANELS = 30
+MILP_SOLUTION = [(i, m) for i in range(1, PANELS + 1) for m in machines]
+# Baseline PM times (hours) the small instance reaches: Grinder and VTD mid-production, CHT never or late
+PM_TIMES = [
+    {"Grinder": 0.05, "VTD": 0.1, "CHT": 1.0},
+    {"Grinder": 0.0, "VTD": 0.02, "CHT": 0.2},
+]
+RUN = {"seed": 7, "pop_size": 20, "generations": 30}
+
+def naive_schedule(chromosome):
+    """Operation-by-operation simulation of one "jox" chromosome: makespan, PM times (hours), completions."""
+    free = [0.0] * len(machines)
+    pm_end = [None] * len(machines)
+    ready = {}
+    completion = []
+    for panel, k in zip(chromosome.panels.tolist(), chromosome.machines.tolist()):
+        m = machines[k]
+        if pm_end[k] is None and free[k] >= ga_solver.milp_pm_times_sec[m]:
+            free[k] += ga_solver.pm_duration_sec
+            pm_end[k] = free[k]
+        free[k] = max(free[k], ready.get(panel, 0.0)) + ga_solver.processing_time[m]
+        ready[panel] = free[k]
+        completion.append(free[k])
+    ends = [free[k] + (ga_solver.pm_duration_sec if pm_end[k] is None else 0.0) for k in range(len(machines))]
+    pm = [ends[k] if pm_end[k] is None else pm_end[k] for k in range(len(machines))]
+    return max(ends), np.array(pm) / 3600, np.array(completion)
+
+@pytest.mark.parametrize("pm_times", PM_TIMES)
+def test_vectorized_fitness_matches_reference(pm_times):
+    random.seed(1)
+    with fitness_parameters(pm_times):
+        parents = initialize_population(MILP_SOLUTION, 2)
+        children = breed(parents, 40)  # One-point crossover and swap mutation, checkpoints updated in place
+        makespans, pm = evaluate_population(encode_population(children))
+        count_makespans, count_pm = evaluate_counts(population_counts(children), len(children[0]))
+        for row, child in enumerate(children):
+            expected_makespan, expected_pm = calculate_makespan_and_pm(child)
+            assert makespans[row] == count_makespans[row] == expected_makespan
+            assert pm[row].tolist() == count_pm[row].tolist() == [expected_pm[m] for m in machines]
+
+@pytest.mark.parametrize("pm_times", PM_TIMES)
+def test_schedule_population_matches_simulation(pm_times):
+    random.seed(2)
+    with fitness_parameters(pm_times):
+        population = initialize_population(MILP_SOLUTION, 10, operators="jox")
+        panels = np.stack([chromosome.panels for chromosome in population])
+        codes = np.stack([chromosome.machines for chromosome in population])
+        makespans, pm, completion = schedule_population(panels, codes)
+        for row, chromosome in enumerate(population):
+            expected_makespan, expected_pm, expected_completion = naive_schedule(chromosome)
+            assert makespans[row] == pytest.approx(expected_makespan)
+            assert pm[row] == pytest.approx(expected_pm)
+            assert completion[row] == pytest.approx(expected_completion)
+
+@pytest.mark.parametrize("operators", ["legacy", "jox"])
+def test_workers_give_the_same_run(operators):
+    single = genetic_algorithm(MILP_SOLUTION, workers=1, operators=operators, **RUN)
+    pooled = genetic_algorithm(MILP_SOLUTION, workers=2, operators=operators, **RUN)
+    assert pooled[1] == single[1]
+    assert pooled[2] == single[2]
+    assert pooled[0].panels.tolist() == single[0].panels.tolist()
+    assert pooled[0].machines.tolist() == single[0].machines.tolist()
+
+@pytest.mark.parametrize("operators", ["legacy", "jox"])
+def test_resumed_run_matches_uninterrupted(tmp_path, operators):
+    path = str(tmp_path / "run.npz")
+    full = genetic_algorithm(MILP_SOLUTION, operators=operators, **RUN)
+    genetic_algorithm(MILP_SOLUTION, operators=operators, checkpoint_path=path, checkpoint_interval=10,
+                      **{**RUN, "generations": 10})
+    resumed = resume_genetic_algorithm(path, generations=RUN["generations"])  # Operators come from the checkpoint
+    assert resumed[1] == full[1]
+    assert resumed[2] == full[2]
+    assert resumed[0].panels.tolist() == full[0].panels.tolist()
+    assert resumed[0].machines.tolist() == full[0].machines.tolist()
+
+def test_resume_refuses_other_operators(tmp_path):
+    path = str(tmp_path / "run.npz")
+    genetic_algorithm(MILP_SOLUTION, operators="jox", checkpoint_path=path, checkpoint_interval=10,
+                      **{**RUN, "generations": 10})
+    with pytest.raises(ValueError, match="operators"):
+        resume_genetic_algorithm(path, generations=RUN["generations"], operators="legacy")
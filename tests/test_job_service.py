@@ -0,0 +1,36 @@
+# Request validation and coalescing of identical jobs in the what-if service
+import asyncio
+
+import pytest
+
+from pm_scheduling.job_service import JobService, make_job
+from pm_scheduling.scenario_sweep import ResultCache
+
+def test_make_job_validates_numbers():
+    assert make_job({"panels_per_week": 200.0}) == make_job({"panels_per_week": 200})
+    for bad in (200.7, 0, float("nan"), "200", True):
+        with pytest.raises(ValueError):
+            make_job({"panels_per_week": bad})
+    with pytest.raises(ValueError):
+        make_job({"solver": "ga", "generations": 10.5})
+
+def test_identical_requests_share_one_solve(tmp_path):
+    pytest.importorskip("pulp")  # CBC ships with PuLP
+
+    async def run():
+        service = JobService(workers=2, cache=ResultCache(str(tmp_path)))
+        try:
+            jobs = [make_job({"panels_per_week": 200})] * 4 + [make_job({"panels_per_week": 200,
+                                                                        "processing_time": {"CHT": 30}})]
+            answers = await asyncio.gather(*(service.submit(job) for job in jobs))
+            again = await service.submit(make_job({"panels_per_week": 200}))
+        finally:
+            service.close()
+        return service.stats, answers, again
+
+    stats, answers, again = asyncio.run(run())
+    assert [answer["source"] for answer in answers] == ["solved", "coalesced", "coalesced", "coalesced", "solved"]
+    assert all(answer["result"] == answers[0]["result"] for answer in answers[:4])
+    assert answers[4]["result"]["makespan"] != answers[0]["result"]["makespan"]
+    assert again["source"] == "cache" and again["result"] == answers[0]["result"]
+    assert stats["solved"] == 2 and stats["coalesced"] == 3 and stats["cache_hits"] == 1